@@ -32,6 +32,9 @@ datas = [
     # Built-in presets
     (os.path.join(src_dir, 'resources', 'presets'),
      os.path.join('resources', 'presets')),
+    # Theme stylesheets
+    (os.path.join(src_dir, 'resources', 'themes'),
+     os.path.join('resources', 'themes')),
 ]
 
 # ============================================================================
@@ -25,6 +25,11 @@ from .export.exporter import Exporter, ExportOptions, ExportFormat
 from utils.debug_log import debug_log
 
 
+# Bump whenever a change to the builders alters the geometry produced for an
+# unchanged config; keys the on-disk preview cache so stale shapes aren't reused
+GEOMETRY_VERSION = 1
+
+
 @dataclass
 class NameplateConfig:
     """Complete configuration for a nameplate."""
@@ -171,13 +176,15 @@ class NameplateBuilder:
     def _get_svg_cache_key(self, svg_elem, target_size: float, depth: float) -> str:
         """Create cache key for SVG geometry based on content (not position)."""
         import hashlib
-        key_parts = [
-            str(getattr(svg_elem, 'name', '')),
-            str(hash(str(getattr(svg_elem, 'paths', [])))),
-            f"size:{target_size:.2f}",
-            f"depth:{depth:.2f}",
-        ]
-        return hashlib.md5('|'.join(key_parts).encode()).hexdigest()[:16]
+        import struct
+        from itertools import chain
+        h = hashlib.md5(str(getattr(svg_elem, 'name', '')).encode())
+        # Hash the path coordinates directly rather than hash(str(paths)),
+        # which builds a large string and is salted per process
+        for path in getattr(svg_elem, 'paths', []):
+            h.update(struct.pack(f'<I{2 * len(path)}d', len(path), *chain.from_iterable(path)))
+        h.update(f"|size:{target_size:.2f}|depth:{depth:.2f}".encode())
+        return h.hexdigest()[:16]
 
     def _get_cached_svg_geometry(self, svg_elem, target_size: float, depth: float = None):
         """Get cached SVG geometry or create and cache it.
@@ -69,6 +69,7 @@ class MainWindow(QMainWindow):
         self._preview_worker = PreviewWorker()
         self._preview_worker.set_builder(self._nameplate_builder)
         self._preview_worker.preview_ready.connect(self._on_preview_ready)
+        self._preview_worker.preview_unchanged.connect(self._on_preview_unchanged)
         self._preview_worker.preview_error.connect(self._on_preview_error)
         self._preview_worker.progress_update.connect(self._on_progress_update)
         self._preview_worker.generation_started.connect(self._on_generation_started)
@@ -391,9 +392,10 @@ class MainWindow(QMainWindow):
     def _update_preview(self):
         """Trigger immediate preview update."""
         self._update_timer.stop()
-        self._do_update_preview()
+        # Explicit refreshes always redraw, even if the geometry is unchanged
+        self._do_update_preview(force=True)
     
-    def _do_update_preview(self):
+    def _do_update_preview(self, force: bool = False):
         """Actually perform the preview update using background worker."""
         # Build config from UI (this is fast)
         config = self._build_config()
@@ -406,7 +408,7 @@ class MainWindow(QMainWindow):
         self._pending_config = config
 
         # Request preview generation in background thread
-        self._preview_worker.request_preview(config)
+        self._preview_worker.request_preview(config, force=force)
 
     def _do_update_preview_no_save(self):
         """Update preview without saving state (used after undo/redo restore)."""
@@ -448,6 +450,10 @@ class MainWindow(QMainWindow):
                 # These are only included in combined geometry, not in separate base/text
                 has_svg_elements = len(config.svg_elements) > 0
 
+                # Clear any SVG overlays once the full geometry is shown,
+                # BUT only if not currently dragging (avoid flicker mid-drag)
+                clear_overlays = not self._svg_panel.is_dragging()
+
                 # For raised text WITHOUT mounts AND without SVG elements,
                 # render base and text separately with different colors.
                 # When mounts are enabled OR SVG elements exist, we must use
@@ -465,16 +471,15 @@ class MainWindow(QMainWindow):
                             plate_thickness = config.plate.thickness
                         text_geom = text_geom.translate((0, 0, plate_thickness))
 
-                    self._preview_manager.update_preview_separate(base_geom, text_geom, auto_fit=self._should_auto_fit)
+                    self._preview_manager.update_preview_separate(
+                        base_geom, text_geom, auto_fit=self._should_auto_fit,
+                        clear_overlays=clear_overlays)
                 else:
                     # For engraved/cutout, text-only, raised with mounts, or raised with SVG elements
                     # - use combined geometry
-                    self._preview_manager.update_preview(geometry, auto_fit=self._should_auto_fit)
-
-                # Clear any SVG overlays now that full geometry is ready
-                # BUT only if not currently dragging (avoid flicker mid-drag)
-                if not self._svg_panel.is_dragging():
-                    self._preview_manager.clear_svg_overlays()
+                    self._preview_manager.update_preview(
+                        geometry, auto_fit=self._should_auto_fit,
+                        clear_overlays=clear_overlays)
 
                 # After first load, don't auto-fit anymore
                 self._should_auto_fit = False
@@ -485,6 +490,13 @@ class MainWindow(QMainWindow):
             self._set_status(f"Error: {e}", is_error=True)
             print(f"Preview display error: {e}")
 
+    def _on_preview_unchanged(self):
+        """Called when the requested preview matches the geometry already shown."""
+        # Drag overlays are normally dropped by _on_preview_ready
+        if self._preview_manager and not self._svg_panel.is_dragging():
+            self._preview_manager.clear_svg_overlays()
+        self._set_status("Ready")
+
     def _on_preview_error(self, error_message: str):
         """Called when preview generation fails."""
         self._set_status(f"Error: {error_message}", is_error=True)
@@ -834,7 +846,7 @@ class MainWindow(QMainWindow):
         # Update overlay transform (this is instant)
         self._preview_manager.update_svg_transform(element_id, x, y, z_offset, rotation)
 
-    def _on_text_position_dragging(self, segment_id: str, v_offset: float):
+    def _on_text_position_dragging(self, segment_id: int, v_offset: float):
         """Handle real-time text position update during slider drag.
 
         For text, we trigger an immediate preview update.
@@ -3,15 +3,117 @@ Text Settings Panel
 UI panel for configuring text content and styling.
 """
 
+import itertools
+
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QFrame, QLineEdit, QGroupBox, QToolButton, QSizePolicy, QCheckBox
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QPushButton,
+    QScrollArea, QFrame, QLineEdit, QGroupBox, QToolButton, QSizePolicy, QCheckBox,
+    QComboBox
 )
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer, QSignalBlocker
 
 from ui.widgets.slider_spin import SliderSpinBox, LabeledComboBox, LabeledLineEdit, FocusComboBox, ResetableComboBox
+from ui.widgets.arc_options import _ARC_DIR_FWD, _ARC_DIR_REV
 from core.geometry.text_builder import TextStyle, TextAlign
 
+# Slider drag ticks are coalesced into at most one preview emission per interval
+_DRAG_COALESCE_MS = 40
+# Panel-level preview signals are throttled (leading + trailing edge)
+_DRAG_THROTTLE_MS = 50
+# Text scale previews are coalesced to about one per frame (latest value wins)
+_SCALE_COALESCE_MS = 16
+# Typing is debounced so a burst of keystrokes triggers a single rebuild
+_TEXT_DEBOUNCE_MS = 150
+
+# Input widget and label rules for text lines and segments. Installed once on
+# TextPanel, so the style engine compiles them for the whole panel rather than
+# per line.
+TEXT_PANEL_GLOBAL_QSS = """
+    TextSegmentWidget QLabel {
+        color: #ddd;
+    }
+    TextSegmentWidget QLabel#formLabel {
+        font-weight: bold;
+    }
+    TextSegmentWidget QLabel#segLabel {
+        font-size: 10px;
+        font-weight: bold;
+        color: #bbb;
+    }
+    TextLineWidget QLabel#lineLabel {
+        font-weight: bold;
+    }
+    TextLineWidget QPushButton#removeLine {
+        font-weight: bold;
+    }
+    TextSegmentWidget QLineEdit {
+        background-color: #555;
+        border: 1px solid #777;
+        border-radius: 3px;
+        padding: 3px;
+        color: #fff;
+    }
+    TextSegmentWidget QComboBox {
+        background-color: #5a5a5a;
+        border: 1px solid #888;
+        border-radius: 3px;
+        padding: 3px;
+        color: #fff;
+    }
+    TextSegmentWidget QComboBox:hover {
+        background-color: #656565;
+        border: 1px solid #999;
+    }
+    TextSegmentWidget QComboBox::drop-down {
+        border: none;
+    }
+    TextSegmentWidget QSlider::groove:horizontal {
+        background: #555;
+        height: 6px;
+        border-radius: 3px;
+    }
+    TextSegmentWidget QSlider::handle:horizontal {
+        background: #888;
+        width: 14px;
+        margin: -4px 0;
+        border-radius: 7px;
+        border: 1px solid #999;
+    }
+    TextSegmentWidget QSlider::handle:horizontal:hover {
+        background: #aaa;
+    }
+    TextSegmentWidget QSlider::sub-page:horizontal {
+        background: #6a8fbd;
+        border-radius: 3px;
+    }
+"""
+
+
+# Combo text <-> config value tables for TextPanel.get_config()/set_config()
+_STYLE_FWD = {"Raised": "raised", "Engraved": "engraved", "Cutout": "cutout"}
+_ALIGN_FWD = {"Left": "left", "Center": "center", "Right": "right"}
+_ORIENT_FWD = {"Horizontal": "horizontal", "Vertical": "vertical"}
+_EFFECT_FWD = {"None": "none", "Bevel": "bevel", "Rounded": "rounded", "Outline": "outline"}
+_STYLE_REV = {v: k for k, v in _STYLE_FWD.items()}
+_ALIGN_REV = {v: k for k, v in _ALIGN_FWD.items()}
+_ORIENT_REV = {v: k for k, v in _ORIENT_FWD.items()}
+_EFFECT_REV = {v: k for k, v in _EFFECT_FWD.items()}
+
+
+def _set_shown(widget, shown: bool):
+    """setVisible() that skips the call, and its layout invalidation, when unchanged."""
+    # isHidden() tracks the widget's own flag, unlike isVisible() which is also
+    # False while the panel itself is off-screen
+    if widget.isHidden() == shown:
+        widget.setVisible(shown)
+
+
+# Hidden segment widgets kept per line for reuse by set_config()
+_SEGMENT_POOL_MAX = 8
+
+# Monotonic segment IDs for real-time preview signals
+_segment_ids = itertools.count(1)
+
 
 class TextSegmentWidget(QFrame):
     """Widget for configuring a single text segment within a line."""
@@ -21,13 +123,19 @@ class TextSegmentWidget(QFrame):
     move_up_requested = pyqtSignal(object)
     move_down_requested = pyqtSignal(object)
     # Signal for real-time position preview: (segment_id, v_offset)
-    position_dragging = pyqtSignal(str, float)
+    position_dragging = pyqtSignal(int, float)
     drag_started = pyqtSignal()
     drag_ended = pyqtSignal()
     # Signal for real-time preview during any slider drag (font size, spacing)
     slider_dragging = pyqtSignal()
-
-    # Stylesheet for the segment widget with improved visibility
+    # Emitted synchronously on every keystroke so parent config caches are
+    # dropped before the debounced changed signal fires
+    config_dirtied = pyqtSignal()
+
+    # Stylesheet for the segment frame and its tool buttons. Rules are scoped
+    # to TextSegmentWidget and installed once on the parent TextLineWidget, so
+    # Qt parses them once per line instead of per segment. Child input
+    # widgets are styled by TEXT_PANEL_GLOBAL_QSS on the panel.
     SEGMENT_STYLE = """
         TextSegmentWidget {
             background-color: #4a4a4a;
@@ -35,58 +143,23 @@ class TextSegmentWidget(QFrame):
             border-radius: 4px;
             margin: 2px;
         }
-        QLabel {
-            color: #ddd;
-        }
-        QLineEdit {
-            background-color: #555;
-            border: 1px solid #777;
-            border-radius: 3px;
-            padding: 3px;
-            color: #fff;
-        }
-        QComboBox {
-            background-color: #5a5a5a;
-            border: 1px solid #888;
-            border-radius: 3px;
-            padding: 3px;
-            color: #fff;
-        }
-        QComboBox:hover {
-            background-color: #656565;
-            border: 1px solid #999;
-        }
-        QComboBox::drop-down {
-            border: none;
-        }
-        QToolButton {
+        TextSegmentWidget QToolButton {
             background-color: #555;
             border: 1px solid #666;
             border-radius: 3px;
             color: #ccc;
         }
-        QToolButton:hover {
+        TextSegmentWidget QToolButton:hover {
             background-color: #666;
             border: 1px solid #888;
         }
-        QSlider::groove:horizontal {
-            background: #555;
-            height: 6px;
-            border-radius: 3px;
-        }
-        QSlider::handle:horizontal {
-            background: #888;
-            width: 14px;
-            margin: -4px 0;
-            border-radius: 7px;
-            border: 1px solid #999;
+        TextSegmentWidget QToolButton#removeSeg {
+            font-weight: bold;
+            color: #ff6666;
         }
-        QSlider::handle:horizontal:hover {
-            background: #aaa;
-        }
-        QSlider::sub-page:horizontal {
-            background: #6a8fbd;
-            border-radius: 3px;
+        TextSegmentWidget QToolButton#removeSeg:hover {
+            color: #ff8888;
+            background-color: #553333;
         }
     """
 
@@ -94,10 +167,27 @@ class TextSegmentWidget(QFrame):
         super().__init__(parent)
         self.segment_number = segment_number
         self.is_icon = False  # Track if this segment is a Nerd Font icon
-        self._segment_id = f"text_seg_{id(self)}"  # Unique ID for real-time preview
+        self._segment_id = next(_segment_ids)  # Unique ID for real-time preview
+        self._config_cache = None  # Last get_config() result
+        self._fonts_key = None  # Font names currently in the font combo
+        self._loading = False  # Suppresses _on_changed while a config is applied
+
+        # Coalesce drag ticks; the latest value is emitted when the timer fires
+        self._pending_v_offset = 0.0
+        self._pos_debounce_timer = QTimer(self)
+        self._pos_debounce_timer.setSingleShot(True)
+        self._pos_debounce_timer.setInterval(_DRAG_COALESCE_MS)
+        self._pos_debounce_timer.timeout.connect(self._emit_pending_position)
+        self._slider_debounce_timer = QTimer(self)
+        self._slider_debounce_timer.setSingleShot(True)
+        self._slider_debounce_timer.setInterval(_DRAG_COALESCE_MS)
+        self._slider_debounce_timer.timeout.connect(self.slider_dragging)
+        self._text_debounce = QTimer(self)
+        self._text_debounce.setSingleShot(True)
+        self._text_debounce.setInterval(_TEXT_DEBOUNCE_MS)
+        self._text_debounce.timeout.connect(self._on_changed)
 
         self.setFrameStyle(QFrame.Box)
-        self.setStyleSheet(self.SEGMENT_STYLE)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(6, 6, 6, 6)
@@ -108,7 +198,7 @@ class TextSegmentWidget(QFrame):
         header.setSpacing(3)
 
         self._label = QLabel(f"Seg {segment_number}")
-        self._label.setStyleSheet("font-size: 10px; font-weight: bold; color: #bbb;")
+        self._label.setObjectName("segLabel")  # Styled by TEXT_PANEL_GLOBAL_QSS
         header.addWidget(self._label)
         header.addStretch()
 
@@ -132,7 +222,7 @@ class TextSegmentWidget(QFrame):
         self._remove_btn = QToolButton()
         self._remove_btn.setText("✕")
         self._remove_btn.setFixedSize(20, 20)
-        self._remove_btn.setStyleSheet("QToolButton { font-weight: bold; color: #ff6666; } QToolButton:hover { color: #ff8888; background-color: #553333; }")
+        self._remove_btn.setObjectName("removeSeg")  # Styled by SEGMENT_STYLE
         self._remove_btn.setToolTip("Remove segment")
         self._remove_btn.clicked.connect(lambda: self.remove_requested.emit(self))
         header.addWidget(self._remove_btn)
@@ -142,7 +232,9 @@ class TextSegmentWidget(QFrame):
         # Text content
         self._content_edit = QLineEdit()
         self._content_edit.setPlaceholderText("Text...")
-        self._content_edit.textChanged.connect(self._on_changed)
+        self._content_edit.textChanged.connect(self._on_text_changed)
+        # editingFinished fires on Return and on focus-out
+        self._content_edit.editingFinished.connect(self._flush_text)
         layout.addWidget(self._content_edit)
 
         # Text transform buttons
@@ -180,6 +272,8 @@ class TextSegmentWidget(QFrame):
         self._font_combo = FocusComboBox()
         self._font_combo.setMinimumWidth(100)
         self._font_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        # Don't measure every font name to size the combo
+        self._font_combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
         self._font_combo.currentTextChanged.connect(self._on_changed)
         font_row.addWidget(self._font_combo)
 
@@ -191,136 +285,260 @@ class TextSegmentWidget(QFrame):
 
         layout.addLayout(font_row)
 
-        # Size and spacing row
-        size_row = QHBoxLayout()
-        size_row.setSpacing(4)
+        # Size, spacing and vertical offset rows share one form layout
+        form = QFormLayout()
+        form.setContentsMargins(0, 0, 0, 0)
+        form.setHorizontalSpacing(4)
+        form.setVerticalSpacing(4)
 
-        size_label = QLabel("Size:")
-        size_label.setStyleSheet("font-weight: bold;")
-        size_row.addWidget(size_label)
         self._size_slider = SliderSpinBox("", 4, 50, 12, decimals=1, suffix="mm")
         self._size_slider.valueChanged.connect(self._on_changed)
         self._size_slider.dragging.connect(self._on_slider_dragging)
-        size_row.addWidget(self._size_slider)
-
-        layout.addLayout(size_row)
+        self._size_slider.dragEnded.connect(self._flush_slider_dragging)
+        size_label = QLabel("Size:")
+        size_label.setObjectName("formLabel")
+        form.addRow(size_label, self._size_slider)
 
         # Letter spacing
-        spacing_row = QHBoxLayout()
-        spacing_row.setSpacing(4)
-        spacing_label = QLabel("Spacing:")
-        spacing_label.setStyleSheet("font-weight: bold;")
-        spacing_row.addWidget(spacing_label)
         self._spacing_slider = SliderSpinBox("", -50, 100, 0, decimals=0, suffix="%")
         self._spacing_slider.valueChanged.connect(self._on_changed)
         self._spacing_slider.dragging.connect(self._on_slider_dragging)
-        spacing_row.addWidget(self._spacing_slider)
-        layout.addLayout(spacing_row)
+        self._spacing_slider.dragEnded.connect(self._flush_slider_dragging)
+        spacing_label = QLabel("Spacing:")
+        spacing_label.setObjectName("formLabel")
+        form.addRow(spacing_label, self._spacing_slider)
 
         # Vertical offset
-        voffset_row = QHBoxLayout()
-        voffset_row.setSpacing(4)
-        voffset_label = QLabel("V-Offset:")
-        voffset_label.setStyleSheet("font-weight: bold;")
-        voffset_row.addWidget(voffset_label)
         self._voffset_slider = SliderSpinBox("", -10, 10, 0, decimals=1, suffix="mm")
         self._voffset_slider.valueChanged.connect(self._on_changed)
         # Connect for real-time preview
         self._voffset_slider.dragging.connect(self._on_position_dragging)
         self._voffset_slider.dragStarted.connect(self.drag_started)
+        self._voffset_slider.dragEnded.connect(self._flush_position)
         self._voffset_slider.dragEnded.connect(self.drag_ended)
-        voffset_row.addWidget(self._voffset_slider)
-        layout.addLayout(voffset_row)
+        voffset_label = QLabel("V-Offset:")
+        voffset_label.setObjectName("formLabel")
+        form.addRow(voffset_label, self._voffset_slider)
+        layout.addLayout(form)
 
     def _on_changed(self, *args):
+        if self._loading:
+            return
+        self._config_cache = None
         self.changed.emit()
 
+    def _on_text_changed(self, text):
+        """Restart the typing debounce; the change is emitted when it settles."""
+        self._config_cache = None
+        self.config_dirtied.emit()
+        self._text_debounce.start()
+
+    def _flush_text(self):
+        """Emit a pending text change immediately."""
+        if self._text_debounce.isActive():
+            self._text_debounce.stop()
+            self._on_changed()
+
     def _on_slider_dragging(self, value):
-        """Emit slider_dragging for real-time preview during slider drag."""
-        self.slider_dragging.emit()
+        """Queue slider_dragging for real-time preview during slider drag."""
+        self._config_cache = None
+        if not self._slider_debounce_timer.isActive():
+            self._slider_debounce_timer.start()
 
-    def _on_position_dragging(self, value):
-        """Emit position during drag for real-time preview."""
-        self.position_dragging.emit(self._segment_id, value)
+    def _flush_slider_dragging(self):
+        """Emit a queued slider_dragging immediately (drag ended)."""
+        if self._slider_debounce_timer.isActive():
+            self._slider_debounce_timer.stop()
+            self.slider_dragging.emit()
 
-    def get_segment_id(self) -> str:
+    def _on_position_dragging(self, value):
+        """Queue the dragged position for real-time preview."""
+        self._config_cache = None
+        self._pending_v_offset = value
+        if not self._pos_debounce_timer.isActive():
+            self._pos_debounce_timer.start()
+
+    def _emit_pending_position(self):
+        """Emit the latest dragged position."""
+        self.position_dragging.emit(self._segment_id, self._pending_v_offset)
+
+    def _flush_position(self):
+        """Emit a queued position immediately (drag ended)."""
+        if self._pos_debounce_timer.isActive():
+            self._pos_debounce_timer.stop()
+            self._emit_pending_position()
+
+    def get_segment_id(self) -> int:
         """Get the unique segment ID for real-time preview."""
         return self._segment_id
 
     def _to_uppercase(self):
         """Convert text to UPPERCASE."""
-        self._content_edit.setText(self._content_edit.text().upper())
+        self._apply_transform(str.upper)
 
     def _to_lowercase(self):
         """Convert text to lowercase."""
-        self._content_edit.setText(self._content_edit.text().lower())
+        self._apply_transform(str.lower)
 
     def _to_titlecase(self):
         """Convert text to Title Case."""
-        self._content_edit.setText(self._content_edit.text().title())
+        self._apply_transform(str.title)
+
+    def _apply_transform(self, transform):
+        """Apply a case transform, skipping it when the text is unchanged."""
+        text = self._content_edit.text()
+        new_text = transform(text)
+        if new_text != text:
+            self._content_edit.setText(new_text)
+            # A button click is a discrete edit; don't wait for the debounce
+            self._flush_text()
 
     def set_fonts(self, font_names: list):
         """Set available fonts."""
+        fonts_key = tuple(font_names)
+        if fonts_key == self._fonts_key:
+            return  # Same list; skip repopulating the combo
+        self._fonts_key = fonts_key
         current = self._font_combo.currentText()
         self._font_combo.clear()
         self._font_combo.addItems(font_names)
         if current in font_names:
             self._font_combo.setCurrentText(current)
 
+    def append_font(self, font_name: str):
+        """Add one font to the end of the font list without repopulating."""
+        self._font_combo.addItem(font_name)
+        self._fonts_key = (self._fonts_key or ()) + (font_name,)
+
     def update_label(self, number: int):
         """Update the segment number label."""
         self.segment_number = number
         self._label.setText(f"Seg {number}")
 
     def get_config(self) -> dict:
-        """Get the segment configuration."""
-        return {
-            'content': self._content_edit.text(),
-            'font_family': self._font_combo.currentText(),
-            'font_style': self._style_combo.currentText(),
-            'font_size': self._size_slider.value(),
-            'letter_spacing': self._spacing_slider.value(),
-            'vertical_offset': self._voffset_slider.value(),
-            'is_icon': self.is_icon,
-        }
+        """Get the segment configuration.
+
+        The returned dict is cached until the segment changes; don't mutate it.
+        """
+        if self._config_cache is None:
+            self._config_cache = {
+                'content': self._content_edit.text(),
+                'font_family': self._font_combo.currentText(),
+                'font_style': self._style_combo.currentText(),
+                'font_size': self._size_slider.value(),
+                'letter_spacing': self._spacing_slider.value(),
+                'vertical_offset': self._voffset_slider.value(),
+                'is_icon': self.is_icon,
+            }
+        return self._config_cache
+
+    def reset_to_defaults(self):
+        """Restore the state of a freshly created segment (for widget reuse)."""
+        self._loading = True
+        try:
+            self._content_edit.clear()
+            if self._font_combo.count():
+                self._font_combo.setCurrentIndex(0)
+            self._style_combo.setCurrentIndex(0)
+            self._size_slider.reset_to_default()
+            self._spacing_slider.reset_to_default()
+            self._voffset_slider.reset_to_default()
+            self.is_icon = False
+        finally:
+            self._loading = False
+            self._text_debounce.stop()
+            self._config_cache = None
 
     def set_config(self, config: dict):
-        """Set the segment configuration."""
-        self._content_edit.setText(config.get('content', ''))
-        if config.get('font_family'):
-            self._font_combo.setCurrentText(config['font_family'])
-        if config.get('font_style'):
-            self._style_combo.setCurrentText(config['font_style'])
-        if config.get('font_size'):
-            self._size_slider.setValue(config['font_size'])
-        if 'letter_spacing' in config:
-            self._spacing_slider.setValue(config['letter_spacing'])
-        if 'vertical_offset' in config:
-            self._voffset_slider.setValue(config['vertical_offset'])
-        self.is_icon = config.get('is_icon', False)
+        """Set the segment configuration, emitting changed once at the end."""
+        self._loading = True
+        try:
+            self._content_edit.setText(config.get('content', ''))
+            if config.get('font_family'):
+                self._font_combo.setCurrentText(config['font_family'])
+            if config.get('font_style'):
+                self._style_combo.setCurrentText(config['font_style'])
+            if config.get('font_size'):
+                self._size_slider.setValue(config['font_size'])
+            if 'letter_spacing' in config:
+                self._spacing_slider.setValue(config['letter_spacing'])
+            if 'vertical_offset' in config:
+                self._voffset_slider.setValue(config['vertical_offset'])
+            self.is_icon = config.get('is_icon', False)
+        finally:
+            self._loading = False
+            # Loaded text is not an edit; drop the debounce setText() started
+            self._text_debounce.stop()
+            # SliderSpinBox.setValue() doesn't emit, so invalidate explicitly
+            self._config_cache = None
+        self.changed.emit()
 
 
 class TextLineWidget(QFrame):
     """Widget for configuring a single line of text with multiple segments."""
 
+    # "+ Add Segment" button, matched through its object name
+    ADD_SEGMENT_STYLE = """
+        QPushButton#addSegment {
+            background-color: #4a7a9a;
+            border: 1px solid #5a8aaa;
+            border-radius: 4px;
+            padding: 4px 8px;
+            color: #ffffff;
+            font-weight: bold;
+        }
+        QPushButton#addSegment:hover {
+            background-color: #5a8aaa;
+            border: 1px solid #6a9aba;
+        }
+        QPushButton#addSegment:pressed {
+            background-color: #3a6a8a;
+        }
+    """
+
+    # Line frame style followed by the shared segment rules. The frame rule
+    # is scoped to TextLineWidget so it doesn't shadow the panel-level
+    # QLineEdit/QLabel rules (the closest style sheet wins in Qt).
+    LINE_STYLE = (
+        "TextLineWidget { background-color: #353535; border-radius: 5px; }"
+        + TextSegmentWidget.SEGMENT_STYLE
+        + ADD_SEGMENT_STYLE
+    )
+
     changed = pyqtSignal()
     remove_requested = pyqtSignal(object)
     # Signal for real-time text position preview: (segment_id, v_offset)
-    segment_position_dragging = pyqtSignal(str, float)
+    segment_position_dragging = pyqtSignal(int, float)
     drag_started = pyqtSignal()
     drag_ended = pyqtSignal()
     # Signal for real-time preview during any slider drag in segments
     segment_slider_dragging = pyqtSignal()
+    # A segment's text changed ahead of its debounced changed signal
+    config_dirtied = pyqtSignal()
 
     def __init__(self, line_number: int = 1, parent=None):
         super().__init__(parent)
         self.line_number = line_number
         self._font_names = []
         self._segment_widgets = []
+        self._segment_index = {}  # id(segment widget) -> index in _segment_widgets
+        self._segment_pool = []  # Hidden, still-connected segments ready for reuse
+        self._loading = False  # Suppresses _on_changed while a config is applied
         self._active_drag_count = 0
+        self._config_cache = None  # Last get_config() result
+
+        # Coalesce gap slider drag ticks
+        self._gap_debounce_timer = QTimer(self)
+        self._gap_debounce_timer.setSingleShot(True)
+        self._gap_debounce_timer.setInterval(_DRAG_COALESCE_MS)
+        self._gap_debounce_timer.timeout.connect(self.segment_slider_dragging)
 
         self.setFrameStyle(QFrame.StyledPanel)
-        self.setStyleSheet("QFrame { background-color: #353535; border-radius: 5px; }")
+        self.setStyleSheet(self.LINE_STYLE)
+
+        # Freeze painting and signals while the child widgets are built
+        self.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(5)
@@ -328,13 +546,13 @@ class TextLineWidget(QFrame):
         # Header with line number and remove button
         header = QHBoxLayout()
         self._line_label = QLabel(f"Line {line_number}")
-        self._line_label.setStyleSheet("font-weight: bold;")
+        self._line_label.setObjectName("lineLabel")  # Styled by TEXT_PANEL_GLOBAL_QSS
         header.addWidget(self._line_label)
         header.addStretch()
 
         self._remove_btn = QPushButton("×")
         self._remove_btn.setFixedSize(20, 20)
-        self._remove_btn.setStyleSheet("QPushButton { font-weight: bold; }")
+        self._remove_btn.setObjectName("removeLine")  # Styled by TEXT_PANEL_GLOBAL_QSS
         self._remove_btn.clicked.connect(lambda: self.remove_requested.emit(self))
         header.addWidget(self._remove_btn)
         layout.addLayout(header)
@@ -351,23 +569,7 @@ class TextLineWidget(QFrame):
 
         add_seg_btn = QPushButton("+ Add Segment")
         add_seg_btn.setFixedWidth(110)
-        add_seg_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4a7a9a;
-                border: 1px solid #5a8aaa;
-                border-radius: 4px;
-                padding: 4px 8px;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a8aaa;
-                border: 1px solid #6a9aba;
-            }
-            QPushButton:pressed {
-                background-color: #3a6a8a;
-            }
-        """)
+        add_seg_btn.setObjectName("addSegment")  # Styled by ADD_SEGMENT_STYLE
         add_seg_btn.clicked.connect(self._add_segment)
         controls_row.addWidget(add_seg_btn)
 
@@ -375,6 +577,7 @@ class TextLineWidget(QFrame):
         self._gap_slider = SliderSpinBox("", 0, 10, 2, decimals=1, suffix="mm")
         self._gap_slider.valueChanged.connect(self._on_changed)
         self._gap_slider.dragging.connect(self._on_gap_dragging)
+        self._gap_slider.dragEnded.connect(self._flush_gap_dragging)
         controls_row.addWidget(self._gap_slider)
 
         layout.addLayout(controls_row)
@@ -382,6 +585,9 @@ class TextLineWidget(QFrame):
         # Add initial segment
         self._add_segment_silent()
 
+        blocker.unblock()
+        self.setUpdatesEnabled(True)
+
     def _add_segment(self):
         """Add a new segment and emit changed signal."""
         self._add_segment_silent()
@@ -390,31 +596,71 @@ class TextLineWidget(QFrame):
     def _add_segment_silent(self):
         """Add a new segment without emitting signals."""
         seg_num = len(self._segment_widgets) + 1
+        if self._segment_pool:
+            self._reuse_segment(self._segment_pool.pop(), seg_num)
+            return
+
         seg_widget = TextSegmentWidget(seg_num)
         seg_widget.set_fonts(self._font_names)
         seg_widget.changed.connect(self._on_changed)
         seg_widget.remove_requested.connect(self._remove_segment)
         seg_widget.move_up_requested.connect(self._move_segment_up)
         seg_widget.move_down_requested.connect(self._move_segment_down)
-        # Connect for real-time preview
-        seg_widget.position_dragging.connect(self.segment_position_dragging)
+        # Drag previews read get_config(), so invalidate before forwarding
+        seg_widget.position_dragging.connect(self._invalidate_config)
+        seg_widget.slider_dragging.connect(self._invalidate_config)
+        seg_widget.config_dirtied.connect(self._invalidate_config)
+        seg_widget.config_dirtied.connect(self.config_dirtied)
+        # Connect for real-time preview. Queued, so preview work runs after
+        # the segment's event handling returns instead of inside it.
+        seg_widget.position_dragging.connect(self.segment_position_dragging, Qt.QueuedConnection)
         seg_widget.drag_started.connect(self._on_drag_started)
         seg_widget.drag_ended.connect(self._on_drag_ended)
         # Connect slider dragging for real-time preview (font size, spacing)
-        seg_widget.slider_dragging.connect(self.segment_slider_dragging)
+        seg_widget.slider_dragging.connect(self.segment_slider_dragging, Qt.QueuedConnection)
+
+        self._segment_index[id(seg_widget)] = len(self._segment_widgets)
+        self._segment_widgets.append(seg_widget)
+        self._segments_layout.addWidget(seg_widget)
+        self._config_cache = None
 
+    def _reuse_segment(self, seg_widget, seg_num: int):
+        """Put a pooled segment back into the layout as a fresh segment."""
+        with QSignalBlocker(seg_widget):
+            seg_widget.set_fonts(self._font_names)
+            seg_widget.reset_to_defaults()
+        seg_widget.update_label(seg_num)
+        seg_widget.blockSignals(False)
+
+        self._segment_index[id(seg_widget)] = len(self._segment_widgets)
         self._segment_widgets.append(seg_widget)
         self._segments_layout.addWidget(seg_widget)
+        seg_widget.show()
+        self._config_cache = None
+
+    def _release_segment(self, seg_widget):
+        """Take a segment out of the layout, pooling it for reuse if there's room."""
+        seg_widget.blockSignals(True)
+        self._segments_layout.removeWidget(seg_widget)
+        if len(self._segment_pool) < _SEGMENT_POOL_MAX:
+            # Connections stay in place; the widget is still parented to the line
+            seg_widget.hide()
+            self._segment_pool.append(seg_widget)
+        else:
+            seg_widget.deleteLater()
 
     def _remove_segment(self, widget):
         """Remove a segment widget."""
         if len(self._segment_widgets) <= 1:
             return  # Keep at least one segment
 
-        idx = self._segment_widgets.index(widget)
-        self._segment_widgets.remove(widget)
-        self._segments_layout.removeWidget(widget)
-        widget.deleteLater()
+        idx = self._segment_index.pop(id(widget))
+        del self._segment_widgets[idx]
+        self._release_segment(widget)
+
+        # Shift the indices of the segments after the removed one
+        for i in range(idx, len(self._segment_widgets)):
+            self._segment_index[id(self._segment_widgets[i])] = i
 
         # Renumber remaining segments
         self._renumber_segments()
@@ -422,43 +668,39 @@ class TextLineWidget(QFrame):
 
     def _move_segment_up(self, widget):
         """Move a segment up (left) in the list."""
-        idx = self._segment_widgets.index(widget)
+        idx = self._segment_index[id(widget)]
         if idx <= 0:
             return  # Already at top
 
         # Swap with previous
-        self._segment_widgets[idx], self._segment_widgets[idx-1] = \
-            self._segment_widgets[idx-1], self._segment_widgets[idx]
+        other = self._segment_widgets[idx-1]
+        self._segment_widgets[idx], self._segment_widgets[idx-1] = other, widget
+        self._segment_index[id(widget)] = idx - 1
+        self._segment_index[id(other)] = idx
 
-        # Rebuild layout
-        self._rebuild_segments_layout()
+        # Reposition only the moved widget in the layout
+        self._segments_layout.removeWidget(widget)
+        self._segments_layout.insertWidget(idx - 1, widget)
+        self._renumber_segments()
         self._on_changed()
 
     def _move_segment_down(self, widget):
         """Move a segment down (right) in the list."""
-        idx = self._segment_widgets.index(widget)
+        idx = self._segment_index[id(widget)]
         if idx >= len(self._segment_widgets) - 1:
             return  # Already at bottom
 
         # Swap with next
-        self._segment_widgets[idx], self._segment_widgets[idx+1] = \
-            self._segment_widgets[idx+1], self._segment_widgets[idx]
-
-        # Rebuild layout
-        self._rebuild_segments_layout()
-        self._on_changed()
-
-    def _rebuild_segments_layout(self):
-        """Rebuild the segments layout after reordering."""
-        # Remove all widgets from layout (but don't delete them)
-        for seg in self._segment_widgets:
-            self._segments_layout.removeWidget(seg)
-
-        # Re-add in new order
-        for seg in self._segment_widgets:
-            self._segments_layout.addWidget(seg)
+        other = self._segment_widgets[idx+1]
+        self._segment_widgets[idx], self._segment_widgets[idx+1] = other, widget
+        self._segment_index[id(widget)] = idx + 1
+        self._segment_index[id(other)] = idx
 
+        # Reposition only the moved widget in the layout
+        self._segments_layout.removeWidget(widget)
+        self._segments_layout.insertWidget(idx + 1, widget)
         self._renumber_segments()
+        self._on_changed()
 
     def _renumber_segments(self):
         """Update segment numbers after reordering or removal."""
@@ -466,11 +708,26 @@ class TextLineWidget(QFrame):
             seg.update_label(i + 1)
 
     def _on_changed(self, *args):
+        if self._loading:
+            return
+        self._config_cache = None
         self.changed.emit()
 
+    def _invalidate_config(self, *args):
+        """Drop the cached get_config() result."""
+        self._config_cache = None
+
     def _on_gap_dragging(self, value):
-        """Emit segment_slider_dragging for real-time preview during gap slider drag."""
-        self.segment_slider_dragging.emit()
+        """Queue segment_slider_dragging for real-time preview during gap slider drag."""
+        self._config_cache = None
+        if not self._gap_debounce_timer.isActive():
+            self._gap_debounce_timer.start()
+
+    def _flush_gap_dragging(self):
+        """Emit a queued segment_slider_dragging immediately (drag ended)."""
+        if self._gap_debounce_timer.isActive():
+            self._gap_debounce_timer.stop()
+            self.segment_slider_dragging.emit()
 
     def _on_drag_started(self):
         """Track when a position drag starts."""
@@ -488,9 +745,20 @@ class TextLineWidget(QFrame):
 
     def set_fonts(self, font_names: list):
         """Set available fonts for all segments."""
-        self._font_names = font_names
+        if font_names == self._font_names:
+            return
+        # Keep a copy so in-place edits of the caller's list are detected
+        self._font_names = list(font_names)
         for widget in self._segment_widgets:
             widget.set_fonts(font_names)
+        self._config_cache = None
+
+    def append_font(self, font_name: str):
+        """Add one font to the end of every segment's font list."""
+        self._font_names.append(font_name)
+        for widget in self._segment_widgets:
+            widget.append_font(font_name)
+        self._config_cache = None
 
     def update_line_label(self, number: int):
         """Update the line number label."""
@@ -498,14 +766,21 @@ class TextLineWidget(QFrame):
         self._line_label.setText(f"Line {number}")
 
     def get_config(self) -> dict:
-        """Get the line configuration with all segments."""
+        """Get the line configuration with all segments.
+
+        The returned dict is cached until the line changes; don't mutate it.
+        """
+        if self._config_cache is not None:
+            return self._config_cache
+
+        # Each segment serves its own cached config
         segments_config = [w.get_config() for w in self._segment_widgets]
 
         # For backward compatibility, if there's only one segment,
         # also include legacy single-segment properties
         if len(segments_config) == 1:
             seg = segments_config[0]
-            return {
+            self._config_cache = {
                 'content': seg.get('content', ''),
                 'font_family': seg.get('font_family', 'Arial'),
                 'font_style': seg.get('font_style', 'Regular'),
@@ -514,50 +789,64 @@ class TextLineWidget(QFrame):
                 'segments': segments_config,
                 'segment_gap': self._gap_slider.value(),
             }
-
-        return {
-            'segments': segments_config,
-            'segment_gap': self._gap_slider.value(),
-        }
+        else:
+            self._config_cache = {
+                'segments': segments_config,
+                'segment_gap': self._gap_slider.value(),
+            }
+        return self._config_cache
 
     def set_config(self, config: dict):
-        """Set the line configuration."""
-        # Block signals during bulk configuration
-        self.blockSignals(True)
+        """Set the line configuration.
+
+        Existing segment widgets are reused in place; the surplus goes to
+        the segment pool and the deficit is taken from it before allocating.
+        """
+        # Check for new segment format
+        segments = config.get('segments', [])
+        if not segments:
+            # Legacy single-segment format - convert to segment
+            segments = [{
+                'content': config.get('content', ''),
+                'font_family': config.get('font_family', 'Arial'),
+                'font_style': config.get('font_style', 'Regular'),
+                'font_size': config.get('font_size', 12),
+                'letter_spacing': config.get('letter_spacing', 0),
+            }]
+
+        # Freeze painting and block signals during bulk configuration
+        self.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self)
+        self._loading = True
 
         try:
-            # Clear existing segments
-            while self._segment_widgets:
+            # Drop surplus segments
+            while len(self._segment_widgets) > len(segments):
                 widget = self._segment_widgets.pop()
-                widget.blockSignals(True)
-                self._segments_layout.removeWidget(widget)
-                widget.deleteLater()
-
-            # Check for new segment format
-            segments = config.get('segments', [])
-
-            if segments:
-                # New multi-segment format
-                for seg_config in segments:
-                    self._add_segment_silent()
-                    self._segment_widgets[-1].set_config(seg_config)
-            else:
-                # Legacy single-segment format - convert to segment
+                del self._segment_index[id(widget)]
+                self._release_segment(widget)
+
+            # Reuse pooled segments, allocating only when the pool is empty
+            while len(self._segment_widgets) < len(segments):
                 self._add_segment_silent()
-                self._segment_widgets[0].set_config({
-                    'content': config.get('content', ''),
-                    'font_family': config.get('font_family', 'Arial'),
-                    'font_style': config.get('font_style', 'Regular'),
-                    'font_size': config.get('font_size', 12),
-                    'letter_spacing': config.get('letter_spacing', 0),
-                })
+
+            for seg_widget, seg_config in zip(self._segment_widgets, segments):
+                # Block at the segment so its setters don't emit at all
+                with QSignalBlocker(seg_widget):
+                    seg_widget.reset_to_defaults()
+                    seg_widget.set_config(seg_config)
 
             # Set gap
             if 'segment_gap' in config:
                 self._gap_slider.setValue(config['segment_gap'])
 
         finally:
-            self.blockSignals(False)
+            self._loading = False
+            self._config_cache = None
+            blocker.unblock()
+            self.setUpdatesEnabled(True)
+            self.update()
+        self.changed.emit()
 
 
 class TextPanel(QWidget):
@@ -567,7 +856,7 @@ class TextPanel(QWidget):
     google_icon_selected = pyqtSignal(dict)  # Emitted when Google icon is selected
     font_awesome_icon_selected = pyqtSignal(dict)  # Emitted when Font Awesome icon is selected
     # Signal for real-time text position preview: (segment_id, v_offset)
-    text_position_dragging = pyqtSignal(str, float)
+    text_position_dragging = pyqtSignal(int, float)
     # Signal for real-time preview during any slider drag
     slider_dragging = pyqtSignal()
     # Signals for real-time text scale preview (size, depth)
@@ -579,13 +868,61 @@ class TextPanel(QWidget):
         super().__init__(parent)
 
         self._font_names = []
+        self._font_names_set = set()  # Membership tests for _font_names
+        # Icon dialogs are built on first use and reused for later opens
+        self._icon_browser_dialog = None
+        self._material_icons_dialog = None
+        self._font_awesome_dialog = None
         self._line_widgets = []
+        # First segment's size slider, read on drag ticks; resolved lazily and
+        # dropped whenever lines or segments may have been added/moved/removed
+        self._cached_first_size_slider = None
+        self._loading = False  # Suppresses _on_changed while a config is applied
         self._active_drag_count = 0
         self._is_text_dragging = False
 
+        # Throttle style slider drag ticks: the first tick of a drag emits
+        # immediately, later ticks emit at most once per _DRAG_THROTTLE_MS
+        self._slider_drag_queued = False
+        self._slider_throttle_timer = QTimer(self)
+        self._slider_throttle_timer.setSingleShot(True)
+        self._slider_throttle_timer.setInterval(_DRAG_THROTTLE_MS)
+        self._slider_throttle_timer.timeout.connect(self._on_slider_throttle_timeout)
+        self._scale_coalesce_timer = QTimer(self)
+        self._scale_coalesce_timer.setSingleShot(True)
+        self._scale_coalesce_timer.setInterval(_SCALE_COALESCE_MS)
+        self._scale_coalesce_timer.timeout.connect(self._emit_text_scale_dragging)
+
+        # Arc values from set_config() parked while arc text is disabled
+        self._pending_arc = None
+        # Collapses all changes made in one event loop pass into a single
+        # settings_changed emission
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(0)
+        self._changed_timer.timeout.connect(self.settings_changed)
+        # Last get_config() result, cleared whenever any child widget changes
+        self._config_cache = None
+        # Widget state produced by set_config({}), used by the reset fast path
+        self._defaults = {
+            'style': 'Raised',
+            'halign': 'Center',
+            'orientation': 'Horizontal',
+            'effect': 'None',
+            'arc_enabled': False,
+            'arc_direction': 'Counterclockwise',
+        }
+
+        # Segment input styling, installed before any line is built
+        self.setStyleSheet(TEXT_PANEL_GLOBAL_QSS)
         self._setup_ui()
     
     def _setup_ui(self):
+        # Build the whole panel with painting and signals frozen so Qt does
+        # a single layout pass at the end
+        self.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         
@@ -598,10 +935,9 @@ class TextPanel(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setMaximumHeight(450)
-        
-        self._lines_container = QWidget()
-        self._lines_layout = QVBoxLayout(self._lines_container)
-        self._lines_layout.setAlignment(Qt.AlignTop)
+        self._lines_scroll = scroll
+
+        self._new_lines_host()
         scroll.setWidget(self._lines_container)
         
         lines_layout.addWidget(scroll)
@@ -615,16 +951,13 @@ class TextPanel(QWidget):
         
         # Text style section
         style_group = QGroupBox("Text Style")
-        style_layout = QVBoxLayout(style_group)
+        style_layout = QFormLayout(style_group)
         
         # Text style (raised/engraved/cutout)
-        style_row = QHBoxLayout()
-        style_row.addWidget(QLabel("Style:"))
         self._text_style_combo = ResetableComboBox(default_text="Raised")
         self._text_style_combo.addItems(["Raised", "Engraved", "Cutout"])
         self._text_style_combo.currentTextChanged.connect(self._on_style_changed)
-        style_row.addWidget(self._text_style_combo, stretch=1)
-        style_layout.addLayout(style_row)
+        style_layout.addRow("Style:", self._text_style_combo)
         
         # Text depth
         self._depth_slider = SliderSpinBox("Depth:", 0.5, 10, 2, decimals=1, suffix=" mm")
@@ -632,83 +965,77 @@ class TextPanel(QWidget):
         self._depth_slider.dragging.connect(self._on_text_scale_dragging)
         self._depth_slider.dragStarted.connect(self._on_text_drag_started)
         self._depth_slider.dragEnded.connect(self._on_text_drag_ended)
-        style_layout.addWidget(self._depth_slider)
+        style_layout.addRow(self._depth_slider)
 
         # Line spacing
         self._spacing_slider = SliderSpinBox("Line Spacing:", 0.8, 3.0, 1.2, decimals=1, suffix="x")
         self._spacing_slider.valueChanged.connect(self._on_changed)
         self._spacing_slider.dragging.connect(self._on_slider_dragging)
-        style_layout.addWidget(self._spacing_slider)
+        self._spacing_slider.dragEnded.connect(self._flush_slider_dragging)
+        style_layout.addRow(self._spacing_slider)
         
         # Alignment
-        align_row = QHBoxLayout()
-        align_row.addWidget(QLabel("Align:"))
         self._align_combo = ResetableComboBox(default_text="Center")
         self._align_combo.addItems(["Left", "Center", "Right"])
         self._align_combo.setCurrentText("Center")
         self._align_combo.currentTextChanged.connect(self._on_changed)
-        align_row.addWidget(self._align_combo, stretch=1)
-        style_layout.addLayout(align_row)
+        style_layout.addRow("Align:", self._align_combo)
 
         # Text orientation
-        orient_row = QHBoxLayout()
-        orient_row.addWidget(QLabel("Orientation:"))
         self._orient_combo = ResetableComboBox(default_text="Horizontal")
         self._orient_combo.addItems(["Horizontal", "Vertical"])
         self._orient_combo.setCurrentText("Horizontal")
         self._orient_combo.currentTextChanged.connect(self._on_changed)
-        orient_row.addWidget(self._orient_combo, stretch=1)
-        style_layout.addLayout(orient_row)
+        style_layout.addRow("Orientation:", self._orient_combo)
 
         # Arc text option
         self._arc_enabled_cb = QCheckBox("Arc Text (Curved)")
         self._arc_enabled_cb.stateChanged.connect(self._on_arc_enabled_changed)
-        style_layout.addWidget(self._arc_enabled_cb)
+        style_layout.addRow(self._arc_enabled_cb)
 
         # Arc options group (hidden by default)
         self._arc_group = QGroupBox("Arc Options")
-        arc_layout = QVBoxLayout(self._arc_group)
+        arc_layout = QFormLayout(self._arc_group)
 
         self._arc_radius_slider = SliderSpinBox("Radius:", 20, 200, 50, decimals=0, suffix=" mm")
         self._arc_radius_slider.valueChanged.connect(self._on_changed)
         self._arc_radius_slider.dragging.connect(self._on_slider_dragging)
-        arc_layout.addWidget(self._arc_radius_slider)
+        self._arc_radius_slider.dragEnded.connect(self._flush_slider_dragging)
+        arc_layout.addRow(self._arc_radius_slider)
 
         self._arc_angle_slider = SliderSpinBox("Angle:", 30, 360, 180, decimals=0, suffix="°")
         self._arc_angle_slider.valueChanged.connect(self._on_changed)
         self._arc_angle_slider.dragging.connect(self._on_slider_dragging)
-        arc_layout.addWidget(self._arc_angle_slider)
+        self._arc_angle_slider.dragEnded.connect(self._flush_slider_dragging)
+        arc_layout.addRow(self._arc_angle_slider)
 
-        arc_dir_row = QHBoxLayout()
-        arc_dir_row.addWidget(QLabel("Direction:"))
         self._arc_direction_combo = ResetableComboBox(default_text="Counterclockwise")
         self._arc_direction_combo.addItems(["Counterclockwise", "Clockwise"])
         self._arc_direction_combo.currentTextChanged.connect(self._on_changed)
-        arc_dir_row.addWidget(self._arc_direction_combo, stretch=1)
-        arc_layout.addLayout(arc_dir_row)
+        arc_layout.addRow("Direction:", self._arc_direction_combo)
 
         self._arc_group.setVisible(False)
-        style_layout.addWidget(self._arc_group)
+        style_layout.addRow(self._arc_group)
 
         # Text effect
-        effect_row = QHBoxLayout()
-        effect_row.addWidget(QLabel("Effect:"))
         self._effect_combo = ResetableComboBox(default_text="None")
         self._effect_combo.addItems(["None", "Bevel", "Rounded", "Outline"])
         self._effect_combo.currentTextChanged.connect(self._on_effect_changed)
-        effect_row.addWidget(self._effect_combo, stretch=1)
-        style_layout.addLayout(effect_row)
+        style_layout.addRow("Effect:", self._effect_combo)
 
         # Effect size (shown only when effect is not None)
         self._effect_size_slider = SliderSpinBox("Effect Size:", 0.1, 2.0, 0.3, decimals=1, suffix=" mm")
         self._effect_size_slider.valueChanged.connect(self._on_changed)
         self._effect_size_slider.dragging.connect(self._on_slider_dragging)
+        self._effect_size_slider.dragEnded.connect(self._flush_slider_dragging)
         self._effect_size_slider.setVisible(False)
-        style_layout.addWidget(self._effect_size_slider)
+        style_layout.addRow(self._effect_size_slider)
 
         layout.addWidget(style_group)
 
-        # Add icon buttons
+        # Add icon buttons. The icon dialogs and their catalogs (loaded through
+        # the memoized get_*_manager() singletons) are imported and built on
+        # first click only, so building this panel never touches icon data.
         font_awesome_btn = QPushButton("🔣 Add Icon (Font Awesome)")
         font_awesome_btn.clicked.connect(self._on_add_font_awesome_icon)
         layout.addWidget(font_awesome_btn)
@@ -725,7 +1052,19 @@ class TextPanel(QWidget):
         
         # Add initial line
         self._add_line()
+
+        # Building the initial UI is not a settings change
+        self._changed_timer.stop()
+        blocker.unblock()
+        self.setUpdatesEnabled(True)
+        self.update()
     
+    def _new_lines_host(self):
+        """Create an empty container for the line widgets."""
+        self._lines_container = QWidget()
+        self._lines_layout = QVBoxLayout(self._lines_container)
+        self._lines_layout.setAlignment(Qt.AlignTop)
+
     def _add_line(self):
         """Add a new text line widget."""
         self._add_line_silent()
@@ -738,6 +1077,12 @@ class TextPanel(QWidget):
         line_widget.set_fonts(self._font_names)
         line_widget.changed.connect(self._on_changed)
         line_widget.remove_requested.connect(self._remove_line)
+        # Drag previews read get_config(), so invalidate before forwarding
+        line_widget.segment_position_dragging.connect(self._invalidate_config)
+        line_widget.segment_slider_dragging.connect(self._invalidate_config)
+        # Typing is debounced; drop the cache per keystroke so get_config()
+        # never returns text older than what is in the edit
+        line_widget.config_dirtied.connect(self._invalidate_config)
         # Connect for real-time preview
         line_widget.segment_position_dragging.connect(self.text_position_dragging)
         line_widget.drag_started.connect(self._on_drag_started)
@@ -745,8 +1090,11 @@ class TextPanel(QWidget):
         # Connect slider dragging from segments (font size, spacing, gap)
         line_widget.segment_slider_dragging.connect(self.slider_dragging)
 
+        if not self._line_widgets:
+            self._cached_first_size_slider = None
         self._line_widgets.append(line_widget)
         self._lines_layout.addWidget(line_widget)
+        self._config_cache = None
     
     def _remove_line(self, widget):
         """Remove a text line widget."""
@@ -754,6 +1102,7 @@ class TextPanel(QWidget):
             return  # Keep at least one line
 
         self._line_widgets.remove(widget)
+        self._cached_first_size_slider = None
         self._lines_layout.removeWidget(widget)
         widget.deleteLater()
 
@@ -764,24 +1113,60 @@ class TextPanel(QWidget):
         self._on_changed()
     
     def _on_changed(self, *args):
-        self.settings_changed.emit()
+        if self._loading:
+            return
+        # Segment add/move/remove reach the panel through here
+        self._cached_first_size_slider = None
+        self._config_cache = None
+        self._queue_emit()
+
+    def _invalidate_config(self, *args):
+        """Drop the cached get_config() result."""
+        self._config_cache = None
 
     def _on_slider_dragging(self, value):
-        """Emit slider_dragging for real-time preview during slider drag."""
-        self.slider_dragging.emit()
+        """Emit slider_dragging for real-time preview, throttled."""
+        self._config_cache = None
+        if self._slider_throttle_timer.isActive():
+            self._slider_drag_queued = True
+        else:
+            self.slider_dragging.emit()
+            self._slider_throttle_timer.start()
+
+    def _on_slider_throttle_timeout(self):
+        """Emit the trailing slider_dragging of a throttle window."""
+        if self._slider_drag_queued:
+            self._slider_drag_queued = False
+            self.slider_dragging.emit()
+            self._slider_throttle_timer.start()
+
+    def _flush_slider_dragging(self):
+        """Emit a queued slider_dragging immediately (drag ended)."""
+        self._slider_throttle_timer.stop()
+        if self._slider_drag_queued:
+            self._slider_drag_queued = False
+            self.slider_dragging.emit()
 
     def _on_text_scale_dragging(self, value):
-        """Emit text scale values for real-time transform-based preview."""
-        # Get average font size from first segment (approximation)
-        avg_size = 12.0  # Default
-        if self._line_widgets:
-            first_line = self._line_widgets[0]
-            if hasattr(first_line, '_segment_widgets') and first_line._segment_widgets:
-                first_seg = first_line._segment_widgets[0]
-                if hasattr(first_seg, '_size_slider'):
-                    avg_size = first_seg._size_slider.value()
-        depth = self._depth_slider.value()
-        self.text_scale_dragging.emit(avg_size, depth)
+        """Queue text scale values for real-time preview, coalesced per frame."""
+        self._config_cache = None
+        if not self._scale_coalesce_timer.isActive():
+            self._scale_coalesce_timer.start()
+
+    def _emit_text_scale_dragging(self):
+        """Emit the current text scale values."""
+        self.text_scale_dragging.emit(self._first_segment_size(), self._depth_slider.value())
+
+    def _first_segment_size(self) -> float:
+        """Get the first segment's font size (approximates the text size)."""
+        slider = self._cached_first_size_slider
+        if slider is None:
+            try:
+                slider = self._line_widgets[0]._segment_widgets[0]._size_slider
+            except IndexError:
+                return 12.0  # Default (no lines or no segments)
+            self._cached_first_size_slider = slider
+        return slider.value()
 
     def _on_text_drag_started(self):
         """Handle text depth/size slider drag start."""
@@ -791,20 +1176,16 @@ class TextPanel(QWidget):
 
     def _on_text_drag_ended(self):
         """Handle text depth/size slider drag end."""
+        if self._scale_coalesce_timer.isActive():
+            self._scale_coalesce_timer.stop()
+            self._emit_text_scale_dragging()
         if self._is_text_dragging:
             self._is_text_dragging = False
             self.text_drag_ended.emit()
 
     def get_current_text_params(self) -> tuple:
         """Get current text size and depth for overlay creation."""
-        avg_size = 12.0
-        if self._line_widgets:
-            first_line = self._line_widgets[0]
-            if hasattr(first_line, '_segment_widgets') and first_line._segment_widgets:
-                first_seg = first_line._segment_widgets[0]
-                if hasattr(first_seg, '_size_slider'):
-                    avg_size = first_seg._size_slider.value()
-        return (avg_size, self._depth_slider.value())
+        return (self._first_segment_size(), self._depth_slider.value())
 
     def _on_drag_started(self):
         """Track when a position drag starts."""
@@ -821,23 +1202,37 @@ class TextPanel(QWidget):
     def _on_effect_changed(self, effect_text: str):
         """Handle effect type change."""
         # Show/hide effect size slider based on effect selection
-        self._effect_size_slider.setVisible(effect_text != "None")
+        _set_shown(self._effect_size_slider, effect_text != "None")
         self._on_changed()
 
     def _on_arc_enabled_changed(self, state: int):
         """Handle arc text enable/disable."""
         is_enabled = state == Qt.Checked
-        self._arc_group.setVisible(is_enabled)
+        _set_shown(self._arc_group, is_enabled)
+        # Apply any arc values that were parked while arc was disabled
+        if is_enabled and self._pending_arc is not None:
+            pending_arc, self._pending_arc = self._pending_arc, None
+            self._apply_arc_config(pending_arc)
         self._on_changed()
 
+    def _apply_arc_config(self, arc_config: dict):
+        """Apply arc radius/angle/direction values to the arc widgets."""
+        if 'arc_radius' in arc_config:
+            self._arc_radius_slider.setValue(arc_config['arc_radius'])
+        if 'arc_angle' in arc_config:
+            self._arc_angle_slider.setValue(arc_config['arc_angle'])
+        self._arc_direction_combo.setCurrentText(arc_config['arc_direction'])
+
     def _on_style_changed(self, style_text: str):
         """Handle text style change."""
         self._on_changed()
 
     def _on_add_icon(self):
         """Open icon browser dialog."""
-        from ui.dialogs.icon_browser import IconBrowserDialog
-        dialog = IconBrowserDialog(self)
+        if self._icon_browser_dialog is None:
+            from ui.dialogs.icon_browser import IconBrowserDialog
+            self._icon_browser_dialog = IconBrowserDialog(self)
+        dialog = self._icon_browser_dialog
         if dialog.exec_():
             icon_data = dialog.get_selected_icon()
             if icon_data:
@@ -847,23 +1242,29 @@ class TextPanel(QWidget):
                     line_widget = self._line_widgets[0]
                     line_widget._add_segment_silent()
                     new_seg = line_widget._segment_widgets[-1]
-                    new_seg._content_edit.setText(icon_char)
+                    # Flag first so the setText() change sees an icon segment
                     new_seg.is_icon = True
+                    new_seg._content_edit.setText(icon_char)
+                    new_seg._flush_text()
                     # Set the font path if available
                     font_path = icon_data.get('font_path')
                     if font_path:
                         # Add the Nerd Font to the combo if not present
                         font_name = "Symbols Nerd Font"
-                        if font_name not in self._font_names:
+                        if font_name not in self._font_names_set:
                             self._font_names.append(font_name)
-                            line_widget.set_fonts(self._font_names)
+                            self._font_names_set.add(font_name)
+                            for widget in self._line_widgets:
+                                widget.append_font(font_name)
                         new_seg._font_combo.setCurrentText(font_name)
                     self._on_changed()
 
     def _on_add_google_icon(self):
         """Open Google Material Icons browser dialog."""
-        from ui.dialogs.material_icons_dialog import MaterialIconsDialog
-        dialog = MaterialIconsDialog(self)
+        if self._material_icons_dialog is None:
+            from ui.dialogs.material_icons_dialog import MaterialIconsDialog
+            self._material_icons_dialog = MaterialIconsDialog(self)
+        dialog = self._material_icons_dialog
         if dialog.exec_():
             icon_data = dialog.get_selected_icon()
             if icon_data:
@@ -876,8 +1277,10 @@ class TextPanel(QWidget):
 
     def _on_add_font_awesome_icon(self):
         """Open Font Awesome Icons browser dialog."""
-        from ui.dialogs.font_awesome_dialog import FontAwesomeDialog
-        dialog = FontAwesomeDialog(self)
+        if self._font_awesome_dialog is None:
+            from ui.dialogs.font_awesome_dialog import FontAwesomeDialog
+            self._font_awesome_dialog = FontAwesomeDialog(self)
+        dialog = self._font_awesome_dialog
         if dialog.exec_():
             icon_data = dialog.get_selected_icon()
             if icon_data:
@@ -887,59 +1290,158 @@ class TextPanel(QWidget):
 
     def set_fonts(self, font_names: list):
         """Set available fonts for all line widgets."""
-        self._font_names = font_names
+        self._font_names = list(font_names)
+        self._font_names_set = set(font_names)
         for widget in self._line_widgets:
             widget.set_fonts(font_names)
+        self._config_cache = None
     
     def get_config(self) -> dict:
-        """Get the complete text configuration."""
-        style_map = {"Raised": "raised", "Engraved": "engraved", "Cutout": "cutout"}
-        align_map = {"Left": "left", "Center": "center", "Right": "right"}
-        orient_map = {"Horizontal": "horizontal", "Vertical": "vertical"}
-        effect_map = {"None": "none", "Bevel": "bevel", "Rounded": "rounded", "Outline": "outline"}
-        arc_dir_map = {"Counterclockwise": "counterclockwise", "Clockwise": "clockwise"}
-
-        return {
+        """Get the complete text configuration.
+
+        The result is cached until _on_changed() or a drag preview marks the
+        panel dirty; callers get a shallow copy.
+        """
+        # Copy so callers can't mutate the cached dict
+        if self._config_cache is not None:
+            return self._config_cache.copy()
+
+        # Report parked arc values so a disabled arc round-trips unchanged
+        pending_arc = self._pending_arc or {}
+
+        self._config_cache = {
             'lines': [w.get_config() for w in self._line_widgets],
-            'style': style_map.get(self._text_style_combo.currentText(), 'raised'),
+            'style': _STYLE_FWD.get(self._text_style_combo.currentText(), 'raised'),
             'depth': self._depth_slider.value(),
             'line_spacing': self._spacing_slider.value(),
-            'halign': align_map.get(self._align_combo.currentText(), 'center'),
-            'orientation': orient_map.get(self._orient_combo.currentText(), 'horizontal'),
-            'effect': effect_map.get(self._effect_combo.currentText(), 'none'),
+            'halign': _ALIGN_FWD.get(self._align_combo.currentText(), 'center'),
+            'orientation': _ORIENT_FWD.get(self._orient_combo.currentText(), 'horizontal'),
+            'effect': _EFFECT_FWD.get(self._effect_combo.currentText(), 'none'),
             'effect_size': self._effect_size_slider.value(),
             'arc_enabled': self._arc_enabled_cb.isChecked(),
-            'arc_radius': self._arc_radius_slider.value(),
-            'arc_angle': self._arc_angle_slider.value(),
-            'arc_direction': arc_dir_map.get(self._arc_direction_combo.currentText(), 'counterclockwise'),
+            'arc_radius': pending_arc.get('arc_radius', self._arc_radius_slider.value()),
+            'arc_angle': pending_arc.get('arc_angle', self._arc_angle_slider.value()),
+            'arc_direction': _ARC_DIR_FWD.get(
+                pending_arc.get('arc_direction', self._arc_direction_combo.currentText()),
+                'counterclockwise'),
         }
+        return self._config_cache.copy()
 
     def set_config(self, config: dict):
         """Set the text configuration."""
-        # Block signals during bulk configuration to prevent cascade updates
-        self.blockSignals(True)
+        self._apply_config(config)
+
+        # Emit a single signal after all configuration is complete. This one
+        # stays synchronous (folding in any queued emission) so callers such
+        # as undo/redo see it before they re-enable state saving.
+        self._changed_timer.stop()
+        self.settings_changed.emit()
+
+    def _reset_to_defaults(self):
+        """Apply an empty config, touching only widgets that are not at default.
+
+        Equivalent to the full rebuild for ``{}``: one empty line, default
+        style/align/orientation/effect and arc disabled. Sliders are left alone
+        because an empty config doesn't set them either.
+        """
+        defaults = self._defaults
+        blocker = QSignalBlocker(self)
+        self._lines_container.setUpdatesEnabled(False)
+        self._loading = True
+
+        try:
+            if len(self._line_widgets) != 1 or not self._is_default_line(self._line_widgets[0]):
+                self._discard_lines()
+                self._add_line_silent()
+
+            for combo, key in ((self._text_style_combo, 'style'),
+                               (self._align_combo, 'halign'),
+                               (self._orient_combo, 'orientation'),
+                               (self._effect_combo, 'effect')):
+                if combo.currentText() != defaults[key]:
+                    combo.setCurrentText(defaults[key])
+            _set_shown(self._effect_size_slider, False)
+
+            if self._arc_enabled_cb.isChecked() != defaults['arc_enabled']:
+                self._arc_enabled_cb.setChecked(defaults['arc_enabled'])
+            _set_shown(self._arc_group, False)
+            # Direction is reset when arc text is next enabled
+            self._pending_arc = {'arc_direction': defaults['arc_direction']}
+        finally:
+            self._loading = False
+            self._cached_first_size_slider = None
+            self._config_cache = None
+            blocker.unblock()
+            self._lines_container.setUpdatesEnabled(True)
+
+    def _is_default_line(self, line_widget) -> bool:
+        """Check whether a line is indistinguishable from a freshly added one."""
+        line_config = line_widget.get_config()
+        default_segment = {
+            'content': '',
+            'font_family': self._font_names[0] if self._font_names else '',
+            'font_style': 'Regular',
+            'font_size': 12,
+            'letter_spacing': 0,
+            'vertical_offset': 0,
+            'is_icon': False,
+        }
+        return (line_config.get('segments') == [default_segment] and
+                line_config.get('segment_gap') == 2)
+
+    def _discard_lines(self):
+        """Delete every line widget (bypasses the "keep one" check)."""
+        lines_layout = self._lines_layout
+        while self._line_widgets:
+            widget = self._line_widgets.pop()
+            # Blocked for good rather than scoped: the widget is going away
+            widget.blockSignals(True)
+            lines_layout.removeWidget(widget)
+            widget.deleteLater()
+
+    def _queue_emit(self):
+        """Queue one settings_changed emission for the next event loop pass."""
+        if not self._changed_timer.isActive():
+            self._changed_timer.start()
+
+    def _apply_config(self, config: dict):
+        """Rebuild the widgets from a text configuration."""
+        if not config:
+            self._reset_to_defaults()
+            return
+
+        # Bind hot attributes to locals for the rebuild loop
+        line_widgets = self._line_widgets
+        add_line_silent = self._add_line_silent
+
+        # The new lines are built into a fresh, off-screen container that is
+        # swapped into the scroll area at the end: one layout pass in total,
+        # and the old container takes all old lines down in one deleteLater
+        blocker = QSignalBlocker(self)
+        for widget in line_widgets:
+            widget.blockSignals(True)  # Going away with the old container
+        line_widgets.clear()
+        old_host = self._lines_scroll.takeWidget()
+        self._new_lines_host()
+        self._loading = True
 
         try:
-            # Clear ALL existing lines (bypass the "keep one" check)
-            while self._line_widgets:
-                widget = self._line_widgets.pop()
-                widget.blockSignals(True)  # Block individual widget signals too
-                self._lines_layout.removeWidget(widget)
-                widget.deleteLater()
 
             # Add lines from config
             lines = config.get('lines', [])
             if not lines:
                 # Ensure at least one empty line
-                self._add_line_silent()
+                add_line_silent()
             else:
                 for line_config in lines:
-                    self._add_line_silent()
-                    self._line_widgets[-1].set_config(line_config)
+                    add_line_silent()
+                    line_widget = line_widgets[-1]
+                    # Block at the line so its setters don't emit at all
+                    with QSignalBlocker(line_widget):
+                        line_widget.set_config(line_config)
 
             # Set style options
-            style_map = {"raised": "Raised", "engraved": "Engraved", "cutout": "Cutout"}
-            style_text = style_map.get(config.get('style'), 'Raised')
+            style_text = _STYLE_REV.get(config.get('style'), 'Raised')
             self._text_style_combo.setCurrentText(style_text)
 
             if 'depth' in config:
@@ -948,35 +1450,43 @@ class TextPanel(QWidget):
             if 'line_spacing' in config:
                 self._spacing_slider.setValue(config['line_spacing'])
 
-            align_map = {"left": "Left", "center": "Center", "right": "Right"}
-            self._align_combo.setCurrentText(align_map.get(config.get('halign'), 'Center'))
+            self._align_combo.setCurrentText(_ALIGN_REV.get(config.get('halign'), 'Center'))
 
-            orient_map = {"horizontal": "Horizontal", "vertical": "Vertical"}
-            self._orient_combo.setCurrentText(orient_map.get(config.get('orientation'), 'Horizontal'))
+            self._orient_combo.setCurrentText(_ORIENT_REV.get(config.get('orientation'), 'Horizontal'))
 
             # Set effect options
-            effect_map = {"none": "None", "bevel": "Bevel", "rounded": "Rounded", "outline": "Outline"}
-            effect_text = effect_map.get(config.get('effect'), 'None')
+            effect_text = _EFFECT_REV.get(config.get('effect'), 'None')
             self._effect_combo.setCurrentText(effect_text)
-            self._effect_size_slider.setVisible(effect_text != "None")
+            _set_shown(self._effect_size_slider, effect_text != "None")
 
             if 'effect_size' in config:
                 self._effect_size_slider.setValue(config['effect_size'])
 
-            # Set arc text options
+            # Set arc text options. Visibility is decided first so the hidden
+            # arc widgets are only touched when arc text is actually enabled.
             arc_enabled = config.get('arc_enabled', False)
+            self._pending_arc = None
             self._arc_enabled_cb.setChecked(arc_enabled)
-            self._arc_group.setVisible(arc_enabled)
+            _set_shown(self._arc_group, arc_enabled)
 
-            if 'arc_radius' in config:
-                self._arc_radius_slider.setValue(config['arc_radius'])
-            if 'arc_angle' in config:
-                self._arc_angle_slider.setValue(config['arc_angle'])
+            arc_config = {
+                'arc_direction': _ARC_DIR_REV.get(config.get('arc_direction'), 'Counterclockwise'),
+            }
+            for key in ('arc_radius', 'arc_angle'):
+                if key in config:
+                    arc_config[key] = config[key]
 
-            arc_dir_map = {"counterclockwise": "Counterclockwise", "clockwise": "Clockwise"}
-            self._arc_direction_combo.setCurrentText(arc_dir_map.get(config.get('arc_direction'), 'Counterclockwise'))
+            if arc_enabled:
+                self._apply_arc_config(arc_config)
+            else:
+                # Applied when the user re-enables arc text
+                self._pending_arc = arc_config
         finally:
-            self.blockSignals(False)
-
-        # Emit a single signal after all configuration is complete
-        self.settings_changed.emit()
+            self._loading = False
+            self._cached_first_size_slider = None
+            self._config_cache = None
+            blocker.unblock()
+            self._lines_scroll.setWidget(self._lines_container)
+            # setWidget() doesn't show a widget added to a visible scroll area
+            self._lines_container.show()
+            old_host.deleteLater()
@@ -3,183 +3,202 @@ Preview Worker
 Background thread for geometry generation to prevent UI blocking.
 """
 
-from PyQt5.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker
+from PyQt5.QtCore import QCoreApplication, QThread, QTimer, pyqtSignal, QMutex, QMutexLocker, QWaitCondition
 from typing import Optional, Any, Tuple
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from pathlib import Path
 import hashlib
-import json
+import os
+import struct
 import time
+import traceback
+import weakref
+
+from utils.debug_log import debug_log
+from utils.resources import get_user_data_dir
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+def _new_hasher():
+    """Create an incremental hasher with a 32-char hex digest (not security-sensitive)."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+# Type tag and payload packed together so each value is one update() call
+_pack_number = struct.Struct('<cd').pack
+_pack_length = struct.Struct('<cI').pack
+
+_KEY_MEMO_SIZE = 64
+
+# On-disk geometry cache: bumped when the key format changes
+_PERSIST_FORMAT = 3
+_PERSIST_PARTS = ('combined', 'base', 'text')
+_MAX_DISK_ENTRIES = 200
+_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+# Window for coalescing bursts of preview requests into one dispatch
+_REQUEST_COALESCE_MS = 30
+
+# How long an idle PreviewWorker thread waits for the next request before exiting
+_IDLE_TIMEOUT_MS = 2000
+
+# NameplateConfig fields that don't affect geometry
+_KEY_SKIP_FIELDS = frozenset({'name'})
+
+
+@lru_cache(maxsize=None)
+def _field_getter(cls, skip=()):
+    """
+    Build a getter returning a dataclass's field values as a tuple.
+
+    Uses one attrgetter per config type, so a whole config object is read in
+    a single C-level call instead of a getattr per field.
+    """
+    names = tuple(f.name for f in fields(cls) if f.name not in skip)
+    if not names:
+        return lambda obj: ()
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return attrgetter(*names)
+
+
+def _feed(h, value, skip=()):
+    """Feed a config value into a hasher, tagged by type.
+
+    Dataclasses are walked field by field and sequences are length-prefixed,
+    so different nestings can't collide.
+    """
+    if isinstance(value, bool):
+        h.update(b'T' if value else b'F')
+    elif isinstance(value, (int, float)):
+        h.update(_pack_number(b'd', value))
+    elif isinstance(value, str):
+        data = value.encode()
+        h.update(_pack_length(b's', len(data)))
+        h.update(data)
+    elif value is None:
+        h.update(b'N')
+    elif isinstance(value, Enum):
+        # The member's value is already a primitive; no str() formatting
+        _feed(h, value.value)
+    elif is_dataclass(value):
+        h.update(b'C')
+        for item in _field_getter(type(value), skip)(value):
+            _feed(h, item)
+    elif isinstance(value, (list, tuple)):
+        h.update(_pack_length(b'L', len(value)))
+        if value and type(value[0]) is tuple and len(value[0]) == 2:
+            # SVG/plate outline points: pack all coordinates in one call
+            try:
+                h.update(b'P')
+                h.update(struct.pack(f'<{2 * len(value)}d', *chain.from_iterable(value)))
+                return
+            except (struct.error, TypeError):
+                pass
+        for item in value:
+            _feed(h, item)
+    elif isinstance(value, dict):
+        h.update(_pack_length(b'M', len(value)))
+        for k in sorted(value, key=str):
+            _feed(h, str(k))
+            _feed(h, value[k])
+    else:
+        # Paths and anything else use their string form
+        _feed(h, str(value))
+
+
+def _default_persist_dir() -> Optional[Path]:
+    """
+    On-disk geometry cache directory.
+
+    Separated per app version, builder GEOMETRY_VERSION and CadQuery version,
+    so an upgrade that changes generation never serves shapes built by the
+    old code.
+    """
+    try:
+        import cadquery as cq
+        from core.nameplate import GEOMETRY_VERSION
+        app_version = QCoreApplication.applicationVersion() or 'dev'
+        path = (get_user_data_dir() / 'geom_cache' /
+                f"v{_PERSIST_FORMAT}-app{app_version}-geo{GEOMETRY_VERSION}"
+                f"-cq{cq.__version__}")
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    except Exception as e:
+        debug_log.warning(f"[GeometryCache] Disk cache unavailable: {e}")
+        return None
 
 
 class GeometryCache:
     """
     LRU cache for preview geometries.
 
-    Avoids regenerating geometry when config hasn't changed.
+    Avoids regenerating geometry when config hasn't changed. With a
+    persist_dir, entries are also spilled to disk as BREP files so they
+    survive restarts.
     """
 
-    def __init__(self, max_entries: int = 10):
+    def __init__(self, max_entries: int = 10, persist_dir=None):
         self._cache: OrderedDict[str, Tuple[Any, Any, Any]] = OrderedDict()
         self._max_entries = max_entries
+        # A Path, or a zero-argument callable resolved on first disk access
+        # (keeps CadQuery out of the constructor)
+        self._persist_dir = persist_dir
+        # Identity memo of recently hashed configs: id -> (weakref, key).
+        # NameplateConfig is an unhashable dataclass with no version counter,
+        # but each preview request builds a fresh one that is not mutated
+        # afterwards, so a live weakref to the same object is enough.
+        self._key_memo: OrderedDict[int, Tuple[Any, str]] = OrderedDict()
 
     def _config_to_key(self, config) -> str:
+        """Get the hash key for a config, reusing it for known instances."""
+        config_id = id(config)
+        memo = self._key_memo.get(config_id)
+        if memo is not None and memo[0]() is config:
+            self._key_memo.move_to_end(config_id)
+            return memo[1]
+        key = self._compute_key(config)
+        try:
+            self._key_memo[config_id] = (weakref.ref(config), key)
+        except TypeError:
+            return key
+        self._key_memo.move_to_end(config_id)
+        if len(self._key_memo) > _KEY_MEMO_SIZE:
+            self._key_memo.popitem(last=False)
+        return key
+
+    def _compute_key(self, config) -> str:
         """
         Create a hash key from a NameplateConfig.
 
-        Only includes geometry-affecting properties.
+        Walks the config's dataclass fields in declaration order, so every
+        geometry-affecting setting (including sweeping and all mount options)
+        is covered without a hand-maintained field list.
         """
         try:
-            # Build a dict of all geometry-affecting values
-            key_parts = []
-
-            # Text config
-            if hasattr(config, 'text'):
-                text = config.text
-                text_data = {
-                    'style': str(text.style) if hasattr(text, 'style') else '',
-                    'depth': getattr(text, 'depth', 0),
-                    'halign': str(getattr(text, 'halign', '')),
-                    'valign': str(getattr(text, 'valign', '')),
-                    'orientation': str(getattr(text, 'orientation', '')),
-                    'line_spacing': getattr(text, 'line_spacing', 0),
-                    'offset_x': getattr(text, 'offset_x', 0),
-                    'offset_y': getattr(text, 'offset_y', 0),
-                    'effect': str(getattr(text, 'effect', '')),
-                    'effect_size': getattr(text, 'effect_size', 0),
-                    # Arc text settings
-                    'arc_enabled': getattr(text, 'arc_enabled', False),
-                    'arc_radius': getattr(text, 'arc_radius', 50.0),
-                    'arc_angle': getattr(text, 'arc_angle', 180.0),
-                    'arc_direction': getattr(text, 'arc_direction', 'counterclockwise'),
-                }
-
-                # Add line content
-                lines_data = []
-                if hasattr(text, 'lines'):
-                    for line in text.lines:
-                        line_data = {'gap': getattr(line, 'segment_gap', 0)}
-                        segments = []
-                        if hasattr(line, 'segments'):
-                            for seg in line.segments:
-                                segments.append({
-                                    'content': getattr(seg, 'content', ''),
-                                    'font': getattr(seg, 'font_family', ''),
-                                    'size': getattr(seg, 'font_size', 0),
-                                    'style': getattr(seg, 'font_style', ''),
-                                    'spacing': getattr(seg, 'letter_spacing', 0),
-                                    'offset': getattr(seg, 'vertical_offset', 0),
-                                })
-                        line_data['segments'] = segments
-                        lines_data.append(line_data)
-                text_data['lines'] = lines_data
-                key_parts.append(('text', text_data))
-
-            # Plate config
-            if hasattr(config, 'plate'):
-                plate = config.plate
-                plate_data = {
-                    'shape': str(getattr(plate, 'shape', '')),
-                    'width': getattr(plate, 'width', 0),
-                    'height': getattr(plate, 'height', 0),
-                    'thickness': getattr(plate, 'thickness', 0),
-                    'corner_radius': getattr(plate, 'corner_radius', 0),
-                    # Auto-sizing
-                    'auto_width': getattr(plate, 'auto_width', False),
-                    'auto_height': getattr(plate, 'auto_height', False),
-                    # Padding
-                    'padding_top': getattr(plate, 'padding_top', 0),
-                    'padding_bottom': getattr(plate, 'padding_bottom', 0),
-                    'padding_left': getattr(plate, 'padding_left', 0),
-                    'padding_right': getattr(plate, 'padding_right', 0),
-                    # Edge finishing
-                    'edge_style': str(getattr(plate, 'edge_style', '')),
-                    'edge_size': getattr(plate, 'edge_size', 0),
-                    'edge_top_only': getattr(plate, 'edge_top_only', True),
-                    # Layered plate
-                    'layered_enabled': getattr(plate, 'layered_enabled', False),
-                    'layer_count': getattr(plate, 'layer_count', 2),
-                    'layer_offset': getattr(plate, 'layer_offset', 0),
-                    'layer_shrink': getattr(plate, 'layer_shrink', 0),
-                    # Inset panel
-                    'inset_enabled': getattr(plate, 'inset_enabled', False),
-                    'inset_depth': getattr(plate, 'inset_depth', 0),
-                    'inset_margin': getattr(plate, 'inset_margin', 0),
-                    'inset_corner_radius': getattr(plate, 'inset_corner_radius', 0),
-                }
-                key_parts.append(('plate', plate_data))
-
-            # Border config
-            if hasattr(config, 'border'):
-                border = config.border
-                border_data = {
-                    'enabled': getattr(border, 'enabled', False),
-                    'style': str(getattr(border, 'style', '')),
-                    'width': getattr(border, 'width', 0),
-                    'height': getattr(border, 'height', 0),
-                    'offset': getattr(border, 'offset', 0),
-                }
-                key_parts.append(('border', border_data))
-
-            # Pattern config
-            if hasattr(config, 'pattern'):
-                pattern = config.pattern
-                pattern_data = {
-                    'type': str(getattr(pattern, 'pattern_type', '')),
-                    'spacing': getattr(pattern, 'spacing', 0),
-                    'size': getattr(pattern, 'size', 0),
-                    'depth': getattr(pattern, 'depth', 0),
-                    'angle': getattr(pattern, 'angle', 0),
-                }
-                key_parts.append(('pattern', pattern_data))
-
-            # Mount config
-            if hasattr(config, 'mount'):
-                mount = config.mount
-                mount_data = {
-                    'type': str(getattr(mount, 'mount_type', '')),
-                }
-                key_parts.append(('mount', mount_data))
-
-            # SVG elements (icons, imported SVGs)
-            if hasattr(config, 'svg_elements') and config.svg_elements:
-                svg_list = []
-                for svg_elem in config.svg_elements:
-                    svg_data = {
-                        'name': getattr(svg_elem, 'name', ''),
-                        'style': str(getattr(svg_elem, 'style', '')),
-                        'size': getattr(svg_elem, 'target_size', 0),
-                        'depth': getattr(svg_elem, 'depth', 0),
-                        'x': getattr(svg_elem, 'position_x', 0),
-                        'y': getattr(svg_elem, 'position_y', 0),
-                        'rotation': getattr(svg_elem, 'rotation', 0),
-                        'paths_hash': hash(str(getattr(svg_elem, 'paths', []))),
-                    }
-                    svg_list.append(svg_data)
-                key_parts.append(('svg_elements', svg_list))
-
-            # QR elements
-            if hasattr(config, 'qr_elements') and config.qr_elements:
-                qr_list = []
-                for qr_elem in config.qr_elements:
-                    qr_data = {
-                        'data': getattr(qr_elem, 'data', ''),
-                        'size': getattr(qr_elem, 'size', 0),
-                        'depth': getattr(qr_elem, 'depth', 0),
-                        'style': str(getattr(qr_elem, 'style', '')),
-                        'x': getattr(qr_elem, 'position_x', 0),
-                        'y': getattr(qr_elem, 'position_y', 0),
-                    }
-                    qr_list.append(qr_data)
-                key_parts.append(('qr_elements', qr_list))
-
-            # Create deterministic JSON string
-            key_str = json.dumps(key_parts, sort_keys=True, default=str)
-            return hashlib.sha256(key_str.encode()).hexdigest()[:32]
+            h = _new_hasher()
+            _feed(h, config, skip=_KEY_SKIP_FIELDS)
+            return h.hexdigest()
 
         except Exception as e:
             print(f"[GeometryCache] Key generation error: {e}")
             # Return unique key on error to prevent false cache hits
-            return hashlib.sha256(str(time.time()).encode()).hexdigest()[:32]
+            h = _new_hasher()
+            h.update(str(time.time()).encode())
+            return h.hexdigest()
 
     def get(self, config) -> Optional[Tuple[Any, Any, Any]]:
         """
@@ -188,33 +207,155 @@ class GeometryCache:
         Returns:
             Tuple of (combined_geometry, base_geometry, text_geometry) or None
         """
-        key = self._config_to_key(config)
+        return self.get_by_key(self._config_to_key(config))
 
-        if key in self._cache:
+    def get_by_key(self, key: str) -> Optional[Tuple[Any, Any, Any]]:
+        """Get cached geometry for a precomputed key."""
+        entry = self._cache.get(key)
+        if entry is not None:
             # Move to end of access order (LRU) - O(1) with OrderedDict
             self._cache.move_to_end(key)
-            print(f"[GeometryCache] Cache HIT for key {key[:8]}...")
-            return self._cache[key]
+            debug_log.debug(f"[GeometryCache] Cache HIT for key {key[:8]}...")
+            return entry
 
-        print(f"[GeometryCache] Cache MISS for key {key[:8]}...")
+        entry = self._load_from_disk(key)
+        if entry is not None:
+            debug_log.debug(f"[GeometryCache] Disk HIT for key {key[:8]}...")
+            self.put_by_key(key, *entry)
+            return entry
+
+        debug_log.debug(f"[GeometryCache] Cache MISS for key {key[:8]}...")
         return None
 
     def put(self, config, geometry, base_geom, text_geom):
         """Cache geometry for a config."""
-        key = self._config_to_key(config)
+        self.put_by_key(self._config_to_key(config), geometry, base_geom, text_geom)
+
+    def put_by_key(self, key: str, geometry, base_geom, text_geom):
+        """Cache geometry under a precomputed key."""
+        # Refresh an existing entry in place rather than evicting another
+        if key in self._cache:
+            self._cache[key] = (geometry, base_geom, text_geom)
+            self._cache.move_to_end(key)
+            return
 
         # Evict oldest entries if cache is full - O(1) with OrderedDict
         while len(self._cache) >= self._max_entries:
             oldest_key, _ = self._cache.popitem(last=False)
-            print(f"[GeometryCache] Evicted old entry {oldest_key[:8]}...")
+            debug_log.debug(f"[GeometryCache] Evicted old entry {oldest_key[:8]}...")
 
         self._cache[key] = (geometry, base_geom, text_geom)
-        print(f"[GeometryCache] Cached entry {key[:8]}... ({len(self._cache)} entries)")
+        debug_log.debug(f"[GeometryCache] Cached entry {key[:8]}... ({len(self._cache)} entries)")
+
+    def key_for(self, config) -> str:
+        """Get the cache key for a config (hash once, then use the *_by_key methods)."""
+        return self._config_to_key(config)
+
+    def _disk_dir(self) -> Optional[Path]:
+        """Resolve the persist directory (None when disk caching is off)."""
+        if callable(self._persist_dir):
+            self._persist_dir = self._persist_dir()
+        return self._persist_dir
+
+    def _disk_path(self, key: str, part: str) -> Path:
+        return self._persist_dir / f"{key}_{part}.brep"
+
+    def _load_from_disk(self, key: str) -> Optional[Tuple[Any, Any, Any]]:
+        """Load a persisted entry, or None if it isn't on disk."""
+        if self._disk_dir() is None:
+            return None
+        combined_path = self._disk_path(key, 'combined')
+        if not combined_path.exists():
+            return None
+        try:
+            import cadquery as cq
+            entry = []
+            for part in _PERSIST_PARTS:
+                path = self._disk_path(key, part)
+                if path.exists():
+                    entry.append(cq.Workplane(obj=cq.Shape.importBrep(str(path))))
+                else:
+                    entry.append(None)
+            os.utime(combined_path)  # keep recently used entries on prune
+            return tuple(entry)
+        except Exception as e:
+            debug_log.warning(f"[GeometryCache] Disk load failed for {key[:8]}: {e}")
+            return None
+
+    def persist(self, key: str):
+        """Write a cached entry to disk (no-op without a persist_dir)."""
+        if self._disk_dir() is None:
+            return
+        entry = self._cache.get(key)
+        if entry is None or entry[0] is None:
+            return
+        if self._disk_path(key, 'combined').exists():
+            return
+
+        shapes = []
+        for geom in entry:
+            if geom is None:
+                shapes.append(None)
+                continue
+            vals = geom.vals() if hasattr(geom, 'vals') else [geom]
+            if len(vals) != 1:
+                return  # multi-object stacks don't round-trip through one BREP
+            shapes.append(vals[0])
+
+        try:
+            # Combined is written last so its presence marks a complete entry
+            for part, shape in reversed(list(zip(_PERSIST_PARTS, shapes))):
+                if shape is None:
+                    continue
+                path = self._disk_path(key, part)
+                tmp_path = path.with_suffix('.tmp')
+                shape.exportBrep(str(tmp_path))
+                os.replace(tmp_path, path)
+        except Exception as e:
+            debug_log.warning(f"[GeometryCache] Disk write failed for {key[:8]}: {e}")
+            return
+
+        self._prune_disk()
+
+    def _entry_size(self, key: str) -> int:
+        """Total bytes of a persisted entry's BREP files."""
+        size = 0
+        for part in _PERSIST_PARTS:
+            try:
+                size += self._disk_path(key, part).stat().st_size
+            except OSError:
+                pass
+        return size
+
+    def _prune_disk(self):
+        """Drop least recently used disk entries beyond _MAX_DISK_ENTRIES or _MAX_DISK_BYTES."""
+        entries = []
+        for path in self._persist_dir.glob('*_combined.brep'):
+            key = path.name[:-len('_combined.brep')]
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            entries.append((mtime, key, self._entry_size(key)))
+
+        count = len(entries)
+        total = sum(size for _, _, size in entries)
+        entries.sort()
+        for _, key, size in entries:
+            if count <= _MAX_DISK_ENTRIES and total <= _MAX_DISK_BYTES:
+                break
+            for part in _PERSIST_PARTS:
+                try:
+                    self._disk_path(key, part).unlink()
+                except OSError:
+                    pass
+            count -= 1
+            total -= size
 
     def clear(self):
         """Clear all cached entries."""
         self._cache.clear()
-        print("[GeometryCache] Cache cleared")
+        debug_log.debug("[GeometryCache] Cache cleared")
 
     def size(self) -> int:
         """Get number of cached entries."""
@@ -234,122 +375,180 @@ class PreviewWorker(QThread):
     progress_update = pyqtSignal(str)  # status message
     generation_started = pyqtSignal()
     generation_finished = pyqtSignal()
+    preview_unchanged = pyqtSignal()  # result is what preview_ready last delivered
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._builder = None
+        self._last_emitted_key = None  # worker thread only
+        # Fresh builds waiting to be written to disk once idle (worker thread only)
+        self._persist_queue = deque(maxlen=10)
         self._config = None
         self._mutex = QMutex()
+        self._wake = QWaitCondition()
         self._abort = False
         self._pending_config = None
-        self._is_running = False
-        self._cache = GeometryCache(max_entries=10)
+        self._pending_force = False  # guarded by _mutex
+        self._is_running = False  # guarded by _mutex
+        self._cache = GeometryCache(max_entries=10, persist_dir=_default_persist_dir)
+
+        # Not restarted by later requests, so continuous drags still dispatch
+        # every _REQUEST_COALESCE_MS with the latest config
+        self._dispatch_timer = QTimer(self)
+        self._dispatch_timer.setSingleShot(True)
+        self._dispatch_timer.setInterval(_REQUEST_COALESCE_MS)
+        self._dispatch_timer.timeout.connect(self._dispatch)
 
     def set_builder(self, builder):
         """Set the nameplate builder instance."""
         self._builder = builder
 
-    def request_preview(self, config):
+    def request_preview(self, config, force: bool = False):
         """
         Request a new preview generation.
 
         If already generating, queues the new config for when current finishes.
-        This ensures we always show the most recent requested config.
+        This ensures we always show the most recent requested config. Requests
+        arriving within _REQUEST_COALESCE_MS of each other are dispatched
+        together, so only the newest is built.
+
+        Args:
+            config: NameplateConfig to build
+            force: Emit preview_ready even if the result matches the last one
+                emitted (e.g. an explicit refresh)
         """
         with QMutexLocker(self._mutex):
             self._pending_config = config
+            self._pending_force = self._pending_force or force
             self._abort = False
 
-        if not self.isRunning():
-            self.start()
+        if not self._dispatch_timer.isActive():
+            self._dispatch_timer.start()
+
+    def _dispatch(self):
+        """Hand the pending config to the worker thread, starting it if idle."""
+        with QMutexLocker(self._mutex):
+            if self._pending_config is None:
+                return
+            if self._is_running:
+                self._wake.wakeOne()
+                return
+            self._is_running = True
+
+        # The thread may still be returning from an idle exit
+        if self.isRunning():
+            self.wait()
+        self.start()
 
     def abort(self):
         """Request abort of current generation."""
         with QMutexLocker(self._mutex):
             self._abort = True
+            self._wake.wakeOne()
 
     def clear_cache(self):
         """Clear the geometry cache."""
         self._cache.clear()
+        self._last_emitted_key = None
 
     def get_cache_size(self) -> int:
         """Get current cache size."""
         return self._cache.size()
 
+    def _check_state(self) -> Tuple[bool, bool]:
+        """Return (abort requested, newer request waiting) under one lock."""
+        with QMutexLocker(self._mutex):
+            return self._abort, self._pending_config is not None
+
     def run(self):
-        """Generate preview geometry in background thread."""
-        self._is_running = True
+        """
+        Generate preview geometry in background thread.
 
+        Sleeps on a wait condition between requests. After _IDLE_TIMEOUT_MS
+        without work it writes queued builds to disk, then exits.
+        """
         while True:
-            # Get pending config
+            # Get pending config, waiting for one if none is queued
             with QMutexLocker(self._mutex):
+                if self._pending_config is None and not self._abort:
+                    self._wake.wait(self._mutex, _IDLE_TIMEOUT_MS)
                 config = self._pending_config
+                force = self._pending_force
                 self._pending_config = None
-                should_abort = self._abort
+                self._pending_force = False
+                if self._abort or (config is None and not self._persist_queue):
+                    self._is_running = False
+                    return
 
-            if config is None or should_abort:
-                break
+            if config is None:
+                self._persist_queued()
+                continue
 
             self.generation_started.emit()
 
             try:
-                # Check cache first
-                cached = self._cache.get(config)
-                if cached is not None:
-                    geometry, base_geom, text_geom = cached
-                    self.progress_update.emit("Loaded from cache")
-
-                    # Check if newer request came in
-                    with QMutexLocker(self._mutex):
-                        if self._pending_config is not None:
-                            continue
-
-                    self.preview_ready.emit(geometry, base_geom, text_geom)
-                    self.generation_finished.emit()
-                    continue
-
-                # Generate new geometry
-                self.progress_update.emit("Generating geometry...")
-
-                if self._builder is None:
-                    self.preview_error.emit("Builder not set")
-                    continue
-
-                # Build geometry
-                self._builder.set_config(config)
-                geometry = self._builder.build()
-
-                # Check for abort or new request
-                with QMutexLocker(self._mutex):
-                    if self._abort or self._pending_config is not None:
-                        self.generation_finished.emit()
-                        continue
-
-                # Get separate geometries for coloring
-                base_geom = self._builder.get_base_geometry()
-                text_geom = self._builder.get_text_geometry()
-
-                # Cache the result
-                self._cache.put(config, geometry, base_geom, text_geom)
-
-                # Final check before emitting
-                with QMutexLocker(self._mutex):
-                    if self._pending_config is not None:
-                        # Newer request waiting, skip this result
-                        self.generation_finished.emit()
-                        continue
-
-                # Emit result
-                self.preview_ready.emit(geometry, base_geom, text_geom)
-
+                self._generate(config, force)
             except Exception as e:
                 self.preview_error.emit(str(e))
-                import traceback
+                # Always reported, independent of the debug logger toggle
                 traceback.print_exc()
 
             self.generation_finished.emit()
 
-        self._is_running = False
+    def _generate(self, config, force: bool = False):
+        """Build (or fetch from cache) and emit geometry for one config."""
+        # Hash once for both the lookup and the store
+        key = self._cache.key_for(config)
+
+        # Check cache first
+        result = self._cache.get_by_key(key)
+        if result is not None:
+            self.progress_update.emit("Loaded from cache")
+        else:
+            # Generate new geometry
+            self.progress_update.emit("Generating geometry...")
+
+            if self._builder is None:
+                self.preview_error.emit("Builder not set")
+                return
+
+            self._builder.set_config(config)
+            geometry = self._builder.build()
+
+            # Get separate geometries for coloring; cache even if superseded
+            # so undo/redo back to this state is a hit
+            result = (geometry,
+                      self._builder.get_base_geometry(),
+                      self._builder.get_text_geometry())
+            self._cache.put_by_key(key, *result)
+            # Disk writes wait for idle, off the interactive path
+            self._persist_queue.append(key)
+
+        # Skip the result if aborted or a newer request is waiting
+        abort, newer_pending = self._check_state()
+        if abort or newer_pending:
+            return
+
+        # Same geometry as the viewer already has: don't trigger a re-tessellation
+        if key == self._last_emitted_key and not force:
+            self.preview_unchanged.emit()
+            return
+
+        self.preview_ready.emit(*result)
+        self._last_emitted_key = key
+
+    def _persist_queued(self):
+        """
+        Write queued builds to disk, stopping as soon as new work arrives.
+
+        Only runs after _IDLE_TIMEOUT_MS without requests, by which time the
+        GUI thread has long finished tessellating the emitted shapes.
+        """
+        while self._persist_queue:
+            abort, newer_pending = self._check_state()
+            if abort or newer_pending:
+                return
+            self._cache.persist(self._persist_queue.popleft())
 
 
 class TessellationWorker(QThread):
@@ -379,28 +578,31 @@ class TessellationWorker(QThread):
     def run(self):
         """Perform tessellation in background."""
         try:
-            import numpy as np
-
             with QMutexLocker(self._mutex):
                 base_geom = self._base_geometry
                 text_geom = self._text_geometry
                 precision = self._precision
 
-            base_verts, base_faces = None, None
-            text_verts, text_faces = None, None
+            self.tessellation_ready.emit(
+                *self._tessellate_pair(base_geom, text_geom, precision))
+
+        except Exception as e:
+            self.tessellation_error.emit(str(e))
 
-            # Tessellate base geometry
-            if base_geom is not None:
-                base_verts, base_faces = self._tessellate(base_geom, precision)
+    def _tessellate_pair(self, base_geom, text_geom, precision: float):
+        """Tessellate base and text; returns (base_verts, base_faces, text_verts, text_faces)."""
+        base_verts, base_faces = None, None
+        text_verts, text_faces = None, None
 
-            # Tessellate text geometry
-            if text_geom is not None:
-                text_verts, text_faces = self._tessellate(text_geom, precision)
+        # Tessellate base geometry
+        if base_geom is not None:
+            base_verts, base_faces = self._tessellate(base_geom, precision)
 
-            self.tessellation_ready.emit(base_verts, base_faces, text_verts, text_faces)
+        # Tessellate text geometry
+        if text_geom is not None:
+            text_verts, text_faces = self._tessellate(text_geom, precision)
 
-        except Exception as e:
-            self.tessellation_error.emit(str(e))
+        return base_verts, base_faces, text_verts, text_faces
 
     def _tessellate(self, geometry, precision: float):
         """Convert geometry to mesh."""
@@ -413,8 +615,14 @@ class TessellationWorker(QThread):
                 shape = geometry
 
             tess = shape.tessellate(precision, precision)
-            vertices = np.array([(v.x, v.y, v.z) for v in tess[0]])
-            faces = np.array(tess[1])
+            # Stream coordinates straight into a contiguous float32 buffer,
+            # the format GL consumes, so the viewer never has to convert
+            n = len(tess[0])
+            vertices = np.fromiter(
+                (c for v in tess[0] for c in (v.x, v.y, v.z)),
+                dtype=np.float32, count=3 * n,
+            ).reshape(n, 3)
+            faces = np.asarray(tess[1], dtype=np.uint32)
 
             return vertices, faces
 
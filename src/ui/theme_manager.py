@@ -9,282 +9,54 @@ from PyQt5.QtCore import Qt
 import json
 from pathlib import Path
 
+from utils.resources import get_resource_path
+
 
 class ThemeManager:
     """Manages application themes (dark/light mode)."""
 
-    DARK_STYLESHEET = """
-        QMainWindow, QWidget {
-            background-color: #2b2b2b;
-            color: #e0e0e0;
-        }
-
-        QMenuBar {
-            background-color: #3c3c3c;
-            color: #e0e0e0;
-        }
-
-        QMenuBar::item:selected {
-            background-color: #505050;
-        }
-
-        QMenu {
-            background-color: #3c3c3c;
-            color: #e0e0e0;
-            border: 1px solid #505050;
-        }
-
-        QMenu::item:selected {
-            background-color: #505050;
-        }
-
-        QTabWidget::pane {
-            border: 1px solid #505050;
-            background-color: #2b2b2b;
-        }
-
-        QTabBar::tab {
-            background-color: #3c3c3c;
-            color: #e0e0e0;
-            padding: 8px 16px;
-            border: 1px solid #505050;
-            border-bottom: none;
-        }
-
-        QTabBar::tab:selected {
-            background-color: #2b2b2b;
-            border-bottom: 1px solid #2b2b2b;
-        }
-
-        QTabBar::tab:hover {
-            background-color: #454545;
-        }
-
-        QGroupBox {
-            border: 1px solid #505050;
-            border-radius: 4px;
-            margin-top: 8px;
-            padding-top: 8px;
-            color: #e0e0e0;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }
-
-        QPushButton {
-            background-color: #3c3c3c;
-            color: #e0e0e0;
-            border: 1px solid #505050;
-            border-radius: 4px;
-            padding: 6px 12px;
-        }
-
-        QPushButton:hover {
-            background-color: #454545;
-            border-color: #606060;
-        }
-
-        QPushButton:pressed {
-            background-color: #353535;
-        }
-
-        QPushButton:disabled {
-            background-color: #2b2b2b;
-            color: #606060;
-        }
-
-        QLineEdit, QTextEdit, QPlainTextEdit {
-            background-color: #1e1e1e;
-            color: #e0e0e0;
-            border: 1px solid #505050;
-            border-radius: 4px;
-            padding: 4px;
-        }
-
-        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
-            border-color: #0078d4;
-        }
-
-        QComboBox {
-            background-color: #3c3c3c;
-            color: #e0e0e0;
-            border: 1px solid #505050;
-            border-radius: 4px;
-            padding: 4px 8px;
-        }
-
-        QComboBox::drop-down {
-            border: none;
-            width: 20px;
-        }
-
-        QComboBox::down-arrow {
-            image: none;
-            border-left: 4px solid transparent;
-            border-right: 4px solid transparent;
-            border-top: 6px solid #e0e0e0;
-        }
-
-        QComboBox QAbstractItemView {
-            background-color: #3c3c3c;
-            color: #e0e0e0;
-            selection-background-color: #0078d4;
-        }
-
-        QSpinBox, QDoubleSpinBox {
-            background-color: #1e1e1e;
-            color: #e0e0e0;
-            border: 1px solid #505050;
-            border-radius: 4px;
-            padding: 4px;
-        }
-
-        QSlider::groove:horizontal {
-            height: 6px;
-            background-color: #505050;
-            border-radius: 3px;
-        }
-
-        QSlider::handle:horizontal {
-            background-color: #0078d4;
-            width: 16px;
-            margin: -5px 0;
-            border-radius: 8px;
-        }
-
-        QSlider::handle:horizontal:hover {
-            background-color: #1e90ff;
-        }
-
-        QScrollBar:vertical {
-            background-color: #2b2b2b;
-            width: 12px;
-            border: none;
-        }
-
-        QScrollBar::handle:vertical {
-            background-color: #505050;
-            border-radius: 6px;
-            min-height: 20px;
-        }
-
-        QScrollBar::handle:vertical:hover {
-            background-color: #606060;
-        }
-
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0;
-        }
-
-        QScrollBar:horizontal {
-            background-color: #2b2b2b;
-            height: 12px;
-            border: none;
-        }
-
-        QScrollBar::handle:horizontal {
-            background-color: #505050;
-            border-radius: 6px;
-            min-width: 20px;
-        }
-
-        QScrollArea {
-            border: none;
-        }
-
-        QLabel {
-            color: #e0e0e0;
-        }
-
-        QCheckBox {
-            color: #e0e0e0;
-        }
-
-        QCheckBox::indicator {
-            width: 16px;
-            height: 16px;
-            border: 1px solid #505050;
-            border-radius: 3px;
-            background-color: #1e1e1e;
-        }
-
-        QCheckBox::indicator:checked {
-            background-color: #0078d4;
-            border-color: #0078d4;
-        }
-
-        QStatusBar {
-            background-color: #3c3c3c;
-            color: #e0e0e0;
-        }
-
-        QProgressBar {
-            background-color: #1e1e1e;
-            border: 1px solid #505050;
-            border-radius: 4px;
-            text-align: center;
-            color: #e0e0e0;
-        }
-
-        QProgressBar::chunk {
-            background-color: #0078d4;
-            border-radius: 3px;
-        }
-
-        QSplitter::handle {
-            background-color: #505050;
-        }
-
-        QToolTip {
-            background-color: #3c3c3c;
-            color: #e0e0e0;
-            border: 1px solid #505050;
-            padding: 4px;
-        }
-
-        QListWidget {
-            background-color: #1e1e1e;
-            color: #e0e0e0;
-            border: 1px solid #505050;
-        }
-
-        QListWidget::item:selected {
-            background-color: #0078d4;
-        }
-
-        QListWidget::item:hover {
-            background-color: #3c3c3c;
-        }
-
-        QTreeWidget, QTreeView {
-            background-color: #1e1e1e;
-            color: #e0e0e0;
-            border: 1px solid #505050;
-        }
-
-        QHeaderView::section {
-            background-color: #3c3c3c;
-            color: #e0e0e0;
-            border: 1px solid #505050;
-            padding: 4px;
-        }
-
-        QDialog {
-            background-color: #2b2b2b;
-            color: #e0e0e0;
-        }
-    """
+    _dark_stylesheet = None  # dark.qss contents, read once
 
     LIGHT_STYLESHEET = ""  # Use system default
 
     def __init__(self):
         self._dark_mode = False
+        self._dark_palette = self._build_dark_palette()
+        self._base_palette = None  # app palette before any theme was applied
+        self._applied_mode = None  # dark/light mode last pushed to the app
         self._settings_path = self._get_settings_path()
         self._load_settings()
 
+    @classmethod
+    def _load_dark(cls) -> str:
+        """Read the dark theme stylesheet from resources once and memoize it."""
+        if cls._dark_stylesheet is None:
+            try:
+                cls._dark_stylesheet = get_resource_path('themes/dark.qss').read_text(encoding='utf-8')
+            except OSError:
+                cls._dark_stylesheet = ""
+        return cls._dark_stylesheet
+
+    @staticmethod
+    def _build_dark_palette() -> QPalette:
+        """Build the palette that carries the dark theme's plain colors."""
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor("#2b2b2b"))
+        palette.setColor(QPalette.WindowText, QColor("#e0e0e0"))
+        palette.setColor(QPalette.Base, QColor("#1e1e1e"))
+        palette.setColor(QPalette.AlternateBase, QColor("#3c3c3c"))
+        palette.setColor(QPalette.Text, QColor("#e0e0e0"))
+        palette.setColor(QPalette.Button, QColor("#3c3c3c"))
+        palette.setColor(QPalette.ButtonText, QColor("#e0e0e0"))
+        palette.setColor(QPalette.ToolTipBase, QColor("#3c3c3c"))
+        palette.setColor(QPalette.ToolTipText, QColor("#e0e0e0"))
+        palette.setColor(QPalette.Highlight, QColor("#0078d4"))
+        palette.setColor(QPalette.HighlightedText, Qt.white)
+        palette.setColor(QPalette.Link, QColor("#0078d4"))
+        for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+            palette.setColor(QPalette.Disabled, role, QColor("#606060"))
+        return palette
+
     def _get_settings_path(self) -> Path:
         """Get path to theme settings file."""
         import sys
@@ -329,6 +101,8 @@ class ThemeManager:
 
     def set_dark_mode(self, enabled: bool):
         """Set dark mode on or off."""
+        if enabled == self._dark_mode:
+            return
         self._dark_mode = enabled
         self._save_settings()
         self.apply_theme()
@@ -339,10 +113,26 @@ class ThemeManager:
         if app is None:
             return
 
+        # showEvent re-applies on every show; skip if nothing changed
+        if self._applied_mode == self._dark_mode:
+            return
+        self._applied_mode = self._dark_mode
+
+        if self._base_palette is None:
+            self._base_palette = QPalette(app.palette())
+
+        # Colors switch through the palette, which only sends PaletteChange
+        # to widgets. setStyleSheet re-polishes the whole tree, so it's only
+        # called when the rules actually differ (no setStyle() nudge either).
         if self._dark_mode:
-            app.setStyleSheet(self.DARK_STYLESHEET)
+            app.setPalette(self._dark_palette)
+            stylesheet = self._load_dark()
         else:
-            app.setStyleSheet(self.LIGHT_STYLESHEET)
+            app.setPalette(self._base_palette)
+            stylesheet = self.LIGHT_STYLESHEET
+
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
 
 
 # Singleton instance
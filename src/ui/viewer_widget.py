@@ -4,11 +4,15 @@ PyQt5 widget for displaying CadQuery geometry with interactive controls.
 Uses PyQtGraph and OpenGL for rendering.
 """
 
+import math
+import weakref
+from collections import OrderedDict
 import numpy as np
 import sip
 from typing import Optional, Tuple
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QCheckBox
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QMatrix4x4, QVector4D
 from ui.widgets.slider_spin import FocusComboBox
 
 try:
@@ -18,6 +22,34 @@ try:
 except ImportError:
     PYQTGRAPH_AVAILABLE = False
 
+if PYQTGRAPH_AVAILABLE:
+    class _SmoothMeshData(gl.MeshData):
+        """
+        MeshData with vertex normals computed in one vectorized pass.
+
+        smooth=True items ask MeshData.vertexNormals() for normals, which
+        pyqtgraph derives with a per-vertex Python loop. This override
+        returns the same area-weighted average, computed once with NumPy.
+        """
+
+        def __init__(self, vertexes: np.ndarray, faces: np.ndarray):
+            super().__init__(vertexes=vertexes, faces=faces)
+            tri = vertexes[faces]
+            face_normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+            normals = np.zeros(vertexes.shape, dtype=np.float32)
+            for k in range(3):
+                np.add.at(normals, faces[:, k], face_normals)
+            lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+            np.divide(normals, lengths, out=normals, where=lengths > 0)
+            self._smooth_normals = normals
+
+        def vertexNormals(self, indexed=None):
+            if indexed is None:
+                return self._smooth_normals
+            if indexed == 'faces':
+                return self._smooth_normals[self.faces()]
+            return super().vertexNormals(indexed)
+
 try:
     import cadquery as cq
     CADQUERY_AVAILABLE = True
@@ -54,6 +86,9 @@ class Viewer3DWidget(QWidget):
         'Black': (0.15, 0.15, 0.15, 1.0),
     }
 
+    # Edge color for shaded meshes (wireframe edges use the mesh color)
+    EDGE_COLOR_DEFAULT = (0.2, 0.2, 0.25, 0.8)
+
     # Available shaders for lighting effects
     # Note: 'balloon' shader provides smooth shading that's brighter than 'shaded'
     SHADERS = {
@@ -77,6 +112,24 @@ class Viewer3DWidget(QWidget):
         'iso_back': {'elevation': 30, 'azimuth': 135},  # Isometric from back
     }
 
+    # View dropdown labels -> VIEW_PRESETS keys (dropdown order)
+    VIEW_LABELS = {
+        'Isometric': 'iso',
+        'Front': 'front',
+        'Back': 'back',
+        'Left': 'left',
+        'Right': 'right',
+        'Top': 'top',
+        'Bottom': 'bottom',
+        'Iso Back': 'iso_back',
+    }
+
+    # Dropdown label -> (elevation, azimuth), resolved once
+    _VIEW_ANGLES_BY_LABEL = {
+        label: (preset['elevation'], preset['azimuth'])
+        for label, preset in zip(VIEW_LABELS, map(VIEW_PRESETS.get, VIEW_LABELS.values()))
+    }
+
     # Text color offset - makes text slightly different from base
     TEXT_COLOR_OFFSET = 0.15
 
@@ -91,12 +144,16 @@ class Viewer3DWidget(QWidget):
         self._grid_item = None
         self._current_color = self.MESH_COLORS['Light Blue']  # Default color
         self._current_shader = 'edgeHilight'  # Edge Highlight shader
+        self._text_color_for = None  # base color _text_color was derived from
+        self._text_color = None
         self._wireframe_mode = False
         self._show_edges = False
         self._cached_vertices = None  # Cache for base mesh refresh
         self._cached_faces = None     # Cache for base mesh refresh
         self._cached_text_vertices = None  # Cache for text mesh refresh
         self._cached_text_faces = None     # Cache for text mesh refresh
+        self._tess_cache = OrderedDict()  # id(geometry) -> (weakref, vertices, faces)
+        self._saved_camera = {'distance': 150, 'elevation': 30, 'azimuth': 45, 'center': None}
         self._model_center = np.array([0.0, 0.0, 0.0])  # Center of current model
         self._model_size = 100.0      # Size of current model for camera distance
 
@@ -108,6 +165,7 @@ class Viewer3DWidget(QWidget):
         # SVG overlay system for real-time preview during drag
         self._svg_overlay_items = {}  # id -> GLMeshItem
         self._svg_overlay_data = {}   # id -> (vertices, faces, base_geometry)
+        self._svg_overlay_xforms = {}  # id -> (reused QMatrix4x4, last (x, y, z, rotation))
 
         # Baseplate overlay system for real-time dimension preview during drag
         self._baseplate_overlay_item = None  # GLMeshItem for baseplate preview
@@ -140,6 +198,9 @@ class Viewer3DWidget(QWidget):
         self._view = gl.GLViewWidget()
         self._view.setBackgroundColor((70, 75, 80, 255))  # Lighter background for contrast
         self._view.setCameraPosition(distance=150, elevation=30, azimuth=45)
+        # The GL view paints every pixel itself, so the backing store can
+        # skip painting the parent background underneath it on each frame
+        self._view.setAttribute(Qt.WA_OpaquePaintEvent)
         
         layout.addWidget(self._view)
         
@@ -164,7 +225,7 @@ class Viewer3DWidget(QWidget):
         # View preset dropdown
         btn_layout.addWidget(QLabel("View:"))
         self._view_combo = FocusComboBox()
-        self._view_combo.addItems(["Isometric", "Front", "Back", "Left", "Right", "Top", "Bottom", "Iso Back"])
+        self._view_combo.addItems(list(self.VIEW_LABELS))
         self._view_combo.setCurrentText("Isometric")
         self._view_combo.currentTextChanged.connect(self._on_view_changed)
         self._view_combo.setMinimumWidth(80)
@@ -258,18 +319,12 @@ class Viewer3DWidget(QWidget):
 
     def _on_view_changed(self, view_name: str):
         """Handle view preset selection."""
-        view_map = {
-            'Isometric': 'iso',
-            'Front': 'front',
-            'Back': 'back',
-            'Left': 'left',
-            'Right': 'right',
-            'Top': 'top',
-            'Bottom': 'bottom',
-            'Iso Back': 'iso_back',
-        }
-        preset = view_map.get(view_name, 'iso')
-        self.set_view(preset)
+        if not PYQTGRAPH_AVAILABLE:
+            return
+        elevation, azimuth = self._VIEW_ANGLES_BY_LABEL.get(
+            view_name, self._VIEW_ANGLES_BY_LABEL['Isometric'])
+        # Keep current distance, just change angles
+        self._view.setCameraPosition(elevation=elevation, azimuth=azimuth)
 
     def _compute_feature_edges(self, vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
         """
@@ -300,59 +355,51 @@ class Viewer3DWidget(QWidget):
         norms[norms == 0] = 1  # Avoid division by zero
         normals = normals / norms
 
-        # Build edge-to-face mapping
-        # Each edge is represented as a tuple of sorted vertex indices
-        edge_faces = {}  # edge -> list of face indices
-
-        for face_idx, face in enumerate(faces):
-            for i in range(3):
-                v_a, v_b = face[i], face[(i + 1) % 3]
-                edge_key = (min(v_a, v_b), max(v_a, v_b))
-                if edge_key not in edge_faces:
-                    edge_faces[edge_key] = []
-                edge_faces[edge_key].append(face_idx)
-
-        # Find feature edges (edges with large dihedral angle or boundary edges)
-        threshold_rad = np.radians(self._edge_angle_threshold)
-        feature_edges = []
-
-        for (v_a, v_b), face_indices in edge_faces.items():
-            is_feature = False
-
-            if len(face_indices) == 1:
-                # Boundary edge - always show
-                is_feature = True
-            elif len(face_indices) >= 2:
-                # Check dihedral angle between first two adjacent faces
-                n1 = normals[face_indices[0]]
-                n2 = normals[face_indices[1]]
-
-                # Dot product gives cos(angle)
-                dot = np.clip(np.dot(n1, n2), -1.0, 1.0)
-                angle = np.arccos(dot)
-
-                if angle > threshold_rad:
-                    is_feature = True
-
-            if is_feature:
-                feature_edges.append([vertices[v_a], vertices[v_b]])
-
-        if not feature_edges:
+        # Every face contributes three undirected edges (sorted index pairs)
+        edges = np.concatenate((faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]))
+        edges.sort(axis=1)
+        edge_faces = np.tile(np.arange(len(faces)), 3)
+
+        # Group identical edges; within a group, faces are in ascending order
+        order = np.lexsort((edge_faces, edges[:, 1], edges[:, 0]))
+        edges = edges[order]
+        edge_faces = edge_faces[order]
+        starts = np.flatnonzero(np.r_[True, np.any(edges[1:] != edges[:-1], axis=1)])
+        counts = np.diff(np.r_[starts, len(edges)])
+
+        # Boundary edges are always shown; shared edges when the dihedral
+        # angle between the first two adjacent faces exceeds the threshold
+        is_feature = counts == 1
+        shared = counts >= 2
+        n1 = normals[edge_faces[starts[shared]]]
+        n2 = normals[edge_faces[starts[shared] + 1]]
+        dots = np.einsum('ij,ij->i', n1, n2)
+        is_feature[shared] = dots < np.cos(np.radians(self._edge_angle_threshold))
+
+        feature_edges = edges[starts[is_feature]]
+        if len(feature_edges) == 0:
             return np.array([])
 
-        return np.array(feature_edges)
+        return vertices[feature_edges]
 
-    def _clear_edge_items(self):
-        """Remove all edge line items from the view."""
-        for item in self._edge_items:
-            if not sip.isdeleted(item):
-                self._view.removeItem(item)
-        self._edge_items = []
+    @staticmethod
+    def _make_mesh_data(vertices: np.ndarray, faces: np.ndarray):
+        """Build MeshData whose smooth vertex normals are precomputed in NumPy."""
+        return _SmoothMeshData(vertices, faces)
 
-        for item in self._text_edge_items:
-            if not sip.isdeleted(item):
-                self._view.removeItem(item)
-        self._text_edge_items = []
+    def _clear_edge_items(self, base: bool = True, text: bool = True):
+        """Remove base and/or text edge line items from the view."""
+        if base:
+            for item in self._edge_items:
+                if not sip.isdeleted(item):
+                    self._view.removeItem(item)
+            self._edge_items = []
+
+        if text:
+            for item in self._text_edge_items:
+                if not sip.isdeleted(item):
+                    self._view.removeItem(item)
+            self._text_edge_items = []
 
     def _add_feature_edges(self, vertices: np.ndarray, faces: np.ndarray,
                            color: Tuple[float, float, float, float],
@@ -384,6 +431,9 @@ class Viewer3DWidget(QWidget):
 
     def _get_text_color(self) -> Tuple[float, float, float, float]:
         """Calculate a contrasting color for text based on base color."""
+        if self._text_color_for == self._current_color:
+            return self._text_color
+
         r, g, b, a = self._current_color
         # Calculate luminance
         luminance = 0.299 * r + 0.587 * g + 0.114 * b
@@ -391,11 +441,45 @@ class Viewer3DWidget(QWidget):
         if luminance > 0.5:
             # Darken the text
             factor = 1.0 - self.TEXT_COLOR_OFFSET * 1.5
-            return (r * factor, g * factor, b * factor, a)
+            text_color = (r * factor, g * factor, b * factor, a)
         else:
             # Lighten the text
             factor = 1.0 + self.TEXT_COLOR_OFFSET * 2
-            return (min(r * factor, 1.0), min(g * factor, 1.0), min(b * factor, 1.0), a)
+            text_color = (min(r * factor, 1.0), min(g * factor, 1.0), min(b * factor, 1.0), a)
+
+        self._text_color_for = self._current_color
+        self._text_color = text_color
+        return text_color
+
+    def _restyle_mesh_item(self, mesh_item, color: Tuple[float, float, float, float]):
+        """
+        Apply current display settings to an existing mesh item in place.
+
+        Keeps the item and its MeshData (vertices, normals, VBO) instead of
+        rebuilding them; the item only re-parses its mesh data when the
+        face/edge drawing mode actually changed.
+        """
+        # Apply shader-adjusted color for visibility
+        adjusted_color = self._get_shader_adjusted_color(color)
+
+        # In wireframe mode, use built-in drawEdges for all edges
+        # Otherwise, disable built-in edges and use feature edge rendering
+        draw_faces = not self._wireframe_mode
+        draw_edges = self._wireframe_mode
+
+        opts = mesh_item.opts
+        mode_changed = opts['drawFaces'] != draw_faces or opts['drawEdges'] != draw_edges
+        opts['drawFaces'] = draw_faces
+        opts['drawEdges'] = draw_edges
+        opts['edgeColor'] = adjusted_color if self._wireframe_mode else self.EDGE_COLOR_DEFAULT
+        opts['shader'] = self._current_shader
+        opts['color'] = adjusted_color
+
+        if mode_changed:
+            # Face/edge arrays are only parsed for enabled modes
+            mesh_item.meshDataChanged()
+        else:
+            mesh_item.update()
 
     def _refresh_mesh_display(self):
         """Refresh mesh display settings without changing camera position."""
@@ -404,28 +488,7 @@ class Viewer3DWidget(QWidget):
 
         # Refresh base mesh
         if self._mesh_item is not None and self._cached_vertices is not None:
-            self._view.removeItem(self._mesh_item)
-
-            # Apply shader-adjusted color for visibility
-            adjusted_color = self._get_shader_adjusted_color(self._current_color)
-
-            mesh_data = gl.MeshData(vertexes=self._cached_vertices, faces=self._cached_faces)
-
-            # In wireframe mode, use built-in drawEdges for all edges
-            # Otherwise, disable built-in edges and use feature edge rendering
-            use_builtin_edges = self._wireframe_mode
-
-            self._mesh_item = gl.GLMeshItem(
-                meshdata=mesh_data,
-                smooth=True,
-                shader=self._current_shader,
-                color=adjusted_color,
-                drawFaces=not self._wireframe_mode,
-                drawEdges=use_builtin_edges,
-                edgeColor=adjusted_color if self._wireframe_mode else (0.2, 0.2, 0.25, 0.8),
-                glOptions='opaque'
-            )
-            self._view.addItem(self._mesh_item)
+            self._restyle_mesh_item(self._mesh_item, self._current_color)
 
             # Add feature edges if enabled (and not in wireframe mode)
             if self._show_edges and not self._wireframe_mode:
@@ -434,27 +497,7 @@ class Viewer3DWidget(QWidget):
 
         # Refresh text mesh with contrasting color
         if self._text_mesh_item is not None and self._cached_text_vertices is not None:
-            self._view.removeItem(self._text_mesh_item)
-
-            text_color = self._get_text_color()
-            # Apply shader-adjusted color for visibility
-            adjusted_text_color = self._get_shader_adjusted_color(text_color)
-
-            mesh_data = gl.MeshData(vertexes=self._cached_text_vertices, faces=self._cached_text_faces)
-
-            use_builtin_edges = self._wireframe_mode
-
-            self._text_mesh_item = gl.GLMeshItem(
-                meshdata=mesh_data,
-                smooth=True,
-                shader=self._current_shader,
-                color=adjusted_text_color,
-                drawFaces=not self._wireframe_mode,
-                drawEdges=use_builtin_edges,
-                edgeColor=adjusted_text_color if self._wireframe_mode else (0.2, 0.2, 0.25, 0.8),
-                glOptions='opaque'
-            )
-            self._view.addItem(self._text_mesh_item)
+            self._restyle_mesh_item(self._text_mesh_item, self._get_text_color())
 
             # Add feature edges for text if enabled (and not in wireframe mode)
             if self._show_edges and not self._wireframe_mode:
@@ -467,31 +510,47 @@ class Viewer3DWidget(QWidget):
             return
         
         axis_length = 20
-        
-        # X axis (red)
-        x_axis = gl.GLLinePlotItem(
-            pos=np.array([[0, 0, 0], [axis_length, 0, 0]]),
-            color=(1, 0, 0, 1),
-            width=2
-        )
-        self._view.addItem(x_axis)
-        
-        # Y axis (green)
-        y_axis = gl.GLLinePlotItem(
-            pos=np.array([[0, 0, 0], [0, axis_length, 0]]),
-            color=(0, 1, 0, 1),
-            width=2
-        )
-        self._view.addItem(y_axis)
-        
-        # Z axis (blue)
-        z_axis = gl.GLLinePlotItem(
-            pos=np.array([[0, 0, 0], [0, 0, axis_length]]),
-            color=(0, 0, 1, 1),
-            width=2
+
+        # X (red), Y (green), Z (blue) as disjoint segments of one item,
+        # so the indicator costs a single draw call
+        axis_pos = np.array([
+            [0, 0, 0], [axis_length, 0, 0],
+            [0, 0, 0], [0, axis_length, 0],
+            [0, 0, 0], [0, 0, axis_length],
+        ], dtype=np.float32)
+        axis_color = np.array([
+            [1, 0, 0, 1], [1, 0, 0, 1],
+            [0, 1, 0, 1], [0, 1, 0, 1],
+            [0, 0, 1, 1], [0, 0, 1, 1],
+        ], dtype=np.float32)
+        axes = gl.GLLinePlotItem(
+            pos=axis_pos,
+            color=axis_color,
+            width=2,
+            mode='lines'
         )
-        self._view.addItem(z_axis)
+        self._view.addItem(axes)
     
+    def _snapshot_camera(self) -> dict:
+        """Record the current camera in the reused _saved_camera dict."""
+        opts = self._view.opts
+        saved = self._saved_camera
+        saved['distance'] = opts.get('distance', 150)
+        saved['elevation'] = opts.get('elevation', 30)
+        saved['azimuth'] = opts.get('azimuth', 45)
+        saved['center'] = opts.get('center', saved['center'])
+        return saved
+
+    def _restore_camera(self, saved: dict):
+        """Reapply a camera state recorded by _snapshot_camera."""
+        if saved['center'] is not None:
+            self._view.opts['center'] = saved['center']
+        self._view.setCameraPosition(
+            distance=saved['distance'],
+            elevation=saved['elevation'],
+            azimuth=saved['azimuth']
+        )
+
     def set_geometry(self, geometry, auto_fit: bool = True) -> bool:
         """
         Set the CadQuery geometry to display.
@@ -513,12 +572,7 @@ class Viewer3DWidget(QWidget):
         # Save current camera state if we need to preserve it
         saved_camera = None
         if not auto_fit:
-            saved_camera = {
-                'distance': self._view.opts.get('distance', 150),
-                'elevation': self._view.opts.get('elevation', 30),
-                'azimuth': self._view.opts.get('azimuth', 45),
-                'center': self._view.opts.get('center', pg.Vector(0, 0, 0)),
-            }
+            saved_camera = self._snapshot_camera()
 
         try:
             # Get mesh data from CadQuery geometry
@@ -534,8 +588,7 @@ class Viewer3DWidget(QWidget):
             # Calculate and cache model center and size
             min_vals = vertices.min(axis=0)
             max_vals = vertices.max(axis=0)
-            self._model_center = (min_vals + max_vals) / 2
-            self._model_size = np.linalg.norm(max_vals - min_vals)
+            self._set_model_bounds(min_vals, max_vals)
 
             # Remove existing meshes (both base and text)
             if self._mesh_item is not None:
@@ -549,12 +602,13 @@ class Viewer3DWidget(QWidget):
             self._cached_text_vertices = None
             self._cached_text_faces = None
             self._text_geometry = None
+            self._base_geometry = None
 
             # Create mesh item with current display settings
             # Apply shader-adjusted color for visibility
             adjusted_color = self._get_shader_adjusted_color(self._current_color)
 
-            mesh_data = gl.MeshData(vertexes=vertices, faces=faces)
+            mesh_data = self._make_mesh_data(vertices, faces)
 
             self._mesh_item = gl.GLMeshItem(
                 meshdata=mesh_data,
@@ -563,7 +617,7 @@ class Viewer3DWidget(QWidget):
                 color=adjusted_color,
                 drawFaces=not self._wireframe_mode,
                 drawEdges=self._show_edges or self._wireframe_mode,
-                edgeColor=(0.2, 0.2, 0.25, 0.8) if not self._wireframe_mode else adjusted_color,
+                edgeColor=self.EDGE_COLOR_DEFAULT if not self._wireframe_mode else adjusted_color,
                 glOptions='opaque'
             )
 
@@ -575,12 +629,7 @@ class Viewer3DWidget(QWidget):
                 self.fit_view()
             elif saved_camera:
                 # Restore camera state to preserve user's view
-                self._view.opts['center'] = saved_camera['center']
-                self._view.setCameraPosition(
-                    distance=saved_camera['distance'],
-                    elevation=saved_camera['elevation'],
-                    azimuth=saved_camera['azimuth']
-                )
+                self._restore_camera(saved_camera)
 
             return True
 
@@ -588,10 +637,55 @@ class Viewer3DWidget(QWidget):
             print(f"Error setting geometry: {e}")
             return False
     
+    def _set_model_bounds(self, min_vals: np.ndarray, max_vals: np.ndarray):
+        """Cache model center and diagonal size from its bounding box."""
+        self._model_center = (min_vals + max_vals) * 0.5
+        # Plain float math: np.linalg.norm's dispatch outweighs 3 elements
+        dx, dy, dz = (float(d) for d in (max_vals - min_vals))
+        self._model_size = math.sqrt(dx * dx + dy * dy + dz * dz)
+
+    # Tessellations kept for recently shown geometry objects
+    TESS_CACHE_SIZE = 8
+
     def _tessellate_geometry(self, geometry) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """
         Convert CadQuery geometry to mesh vertices and faces.
+
+        Results are cached by object identity, so re-showing the same
+        geometry (e.g. a re-emitted preview or repeated overlay) skips OCCT.
         """
+        hit = self._cached_tessellation(geometry)
+        if hit is not None:
+            return hit
+        vertices, faces = self._tessellate_uncached(geometry)
+        self._store_tessellation(geometry, vertices, faces)
+        return vertices, faces
+
+    def _cached_tessellation(self, geometry):
+        """Return the cached (vertices, faces) for geometry, or None."""
+        key = id(geometry)
+        hit = self._tess_cache.get(key)
+        if hit is not None and hit[0]() is geometry:
+            self._tess_cache.move_to_end(key)
+            return hit[1], hit[2]
+        return None
+
+    def _store_tessellation(self, geometry, vertices, faces):
+        """Remember a tessellation result, evicting the oldest entry."""
+        if vertices is None:
+            return
+        try:
+            ref = weakref.ref(geometry)
+        except TypeError:
+            return
+        key = id(geometry)
+        self._tess_cache[key] = (ref, vertices, faces)
+        self._tess_cache.move_to_end(key)
+        if len(self._tess_cache) > self.TESS_CACHE_SIZE:
+            self._tess_cache.popitem(last=False)
+
+    def _tessellate_uncached(self, geometry) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Tessellate geometry with OCCT (no caching)."""
         try:
             # Get the shape from workplane
             if hasattr(geometry, 'val'):
@@ -603,8 +697,14 @@ class Viewer3DWidget(QWidget):
             # Use 0.2mm precision for faster preview (0.1 for final export)
             tess = shape.tessellate(0.2, 0.2)
             
-            vertices = np.array([(v.x, v.y, v.z) for v in tess[0]])
-            faces = np.array(tess[1])
+            # Stream coordinates into a float32 buffer (GL's vertex format)
+            # instead of building a tuple per vertex for np.array to infer
+            n = len(tess[0])
+            vertices = np.fromiter(
+                (c for v in tess[0] for c in (v.x, v.y, v.z)),
+                dtype=np.float32, count=3 * n,
+            ).reshape(n, 3)
+            faces = np.asarray(tess[1], dtype=np.uint32)
             
             return vertices, faces
             
@@ -650,25 +750,47 @@ class Viewer3DWidget(QWidget):
         # Save current camera state if we need to preserve it
         saved_camera = None
         if not auto_fit:
-            saved_camera = {
-                'distance': self._view.opts.get('distance', 150),
-                'elevation': self._view.opts.get('elevation', 30),
-                'azimuth': self._view.opts.get('azimuth', 45),
-                'center': self._view.opts.get('center', pg.Vector(0, 0, 0)),
-            }
-
-        # Clear existing meshes
-        self.clear_geometry()
+            saved_camera = self._snapshot_camera()
 
         # Handle case where both are None
         if base_geometry is None and text_geometry is None:
+            self.clear_geometry()
             return True
 
+        # Keep a mesh whose geometry object is unchanged (its VBO stays
+        # uploaded); only tear down the parts that differ.
+        keep_base = (base_geometry is not None and base_geometry is self._base_geometry
+                     and self._mesh_item is not None)
+        keep_text = (text_geometry is not None and text_geometry is self._text_geometry
+                     and self._text_mesh_item is not None)
+
+        if not keep_base:
+            if self._mesh_item is not None:
+                self._view.removeItem(self._mesh_item)
+                self._mesh_item = None
+            self._base_geometry = None
+            self._cached_vertices = None
+            self._cached_faces = None
+        if not keep_text:
+            if self._text_mesh_item is not None:
+                self._view.removeItem(self._text_mesh_item)
+                self._text_mesh_item = None
+            self._text_geometry = None
+            self._cached_text_vertices = None
+            self._cached_text_faces = None
+        self._clear_edge_items(base=not keep_base, text=not keep_text)
+        # SVG overlays preview the old geometry; drop them whenever a mesh changes
+        if not (keep_base and keep_text):
+            self.clear_svg_overlays()
+        self._geometry = None
+
         try:
             all_vertices = []
 
             # Process base geometry
-            if base_geometry is not None:
+            if keep_base:
+                all_vertices.append(self._cached_vertices)
+            elif base_geometry is not None:
                 vertices, faces = self._tessellate_geometry(base_geometry)
                 if vertices is not None and faces is not None:
                     self._cached_vertices = vertices
@@ -678,7 +800,7 @@ class Viewer3DWidget(QWidget):
                     # Apply shader-adjusted color for visibility
                     adjusted_color = self._get_shader_adjusted_color(self._current_color)
 
-                    mesh_data = gl.MeshData(vertexes=vertices, faces=faces)
+                    mesh_data = self._make_mesh_data(vertices, faces)
                     self._mesh_item = gl.GLMeshItem(
                         meshdata=mesh_data,
                         smooth=True,
@@ -686,14 +808,16 @@ class Viewer3DWidget(QWidget):
                         color=adjusted_color,
                         drawFaces=not self._wireframe_mode,
                         drawEdges=self._show_edges or self._wireframe_mode,
-                        edgeColor=(0.2, 0.2, 0.25, 0.8) if not self._wireframe_mode else adjusted_color,
+                        edgeColor=self.EDGE_COLOR_DEFAULT if not self._wireframe_mode else adjusted_color,
                         glOptions='opaque'
                     )
                     self._view.addItem(self._mesh_item)
                     self._base_geometry = base_geometry
 
             # Process text geometry
-            if text_geometry is not None:
+            if keep_text:
+                all_vertices.append(self._cached_text_vertices)
+            elif text_geometry is not None:
                 vertices, faces = self._tessellate_geometry(text_geometry)
                 if vertices is not None and faces is not None:
                     self._cached_text_vertices = vertices
@@ -704,7 +828,7 @@ class Viewer3DWidget(QWidget):
                     # Apply shader-adjusted color for visibility
                     adjusted_text_color = self._get_shader_adjusted_color(text_color)
 
-                    mesh_data = gl.MeshData(vertexes=vertices, faces=faces)
+                    mesh_data = self._make_mesh_data(vertices, faces)
                     self._text_mesh_item = gl.GLMeshItem(
                         meshdata=mesh_data,
                         smooth=True,
@@ -712,31 +836,25 @@ class Viewer3DWidget(QWidget):
                         color=adjusted_text_color,
                         drawFaces=not self._wireframe_mode,
                         drawEdges=self._show_edges or self._wireframe_mode,
-                        edgeColor=(0.2, 0.2, 0.25, 0.8) if not self._wireframe_mode else adjusted_text_color,
+                        edgeColor=self.EDGE_COLOR_DEFAULT if not self._wireframe_mode else adjusted_text_color,
                         glOptions='opaque'
                     )
                     self._view.addItem(self._text_mesh_item)
                     self._text_geometry = text_geometry
 
             # Calculate model center and size from combined geometry
+            # Reduce each array separately rather than stacking them
             if all_vertices:
-                combined = np.vstack(all_vertices)
-                min_vals = combined.min(axis=0)
-                max_vals = combined.max(axis=0)
-                self._model_center = (min_vals + max_vals) / 2
-                self._model_size = np.linalg.norm(max_vals - min_vals)
+                min_vals = np.min([v.min(axis=0) for v in all_vertices], axis=0)
+                max_vals = np.max([v.max(axis=0) for v in all_vertices], axis=0)
+                self._set_model_bounds(min_vals, max_vals)
 
             # Auto-fit view only if requested
             if auto_fit:
                 self.fit_view()
             elif saved_camera:
                 # Restore camera state to preserve user's view
-                self._view.opts['center'] = saved_camera['center']
-                self._view.setCameraPosition(
-                    distance=saved_camera['distance'],
-                    elevation=saved_camera['elevation'],
-                    azimuth=saved_camera['azimuth']
-                )
+                self._restore_camera(saved_camera)
 
             return True
 
@@ -788,12 +906,23 @@ class Viewer3DWidget(QWidget):
         if vertices is None or faces is None:
             return
 
-        # Remove existing overlay if present
-        if svg_id in self._svg_overlay_items:
-            self._view.removeItem(self._svg_overlay_items[svg_id])
+        self._svg_overlay_xforms.pop(svg_id, None)
+
+        # Re-adding an existing overlay: swap its mesh in place rather than
+        # tearing the item out of the view's draw list and adding a new one
+        mesh_item = self._svg_overlay_items.get(svg_id)
+        if mesh_item is not None:
+            previous = self._svg_overlay_data.get(svg_id)
+            if previous is None or previous[0] is not vertices:
+                mesh_item.setMeshData(meshdata=self._make_mesh_data(vertices, faces))
+            mesh_item.opts['color'] = color
+            mesh_item.resetTransform()
+            mesh_item.update()
+            self._svg_overlay_data[svg_id] = (vertices, faces, geometry)
+            return
 
         # Create mesh item
-        mesh_data = gl.MeshData(vertexes=vertices, faces=faces)
+        mesh_data = self._make_mesh_data(vertices, faces)
         mesh_item = gl.GLMeshItem(
             meshdata=mesh_data,
             smooth=True,
@@ -808,7 +937,7 @@ class Viewer3DWidget(QWidget):
 
         # Store references
         self._svg_overlay_items[svg_id] = mesh_item
-        self._svg_overlay_data[svg_id] = (vertices.copy(), faces.copy(), geometry)
+        self._svg_overlay_data[svg_id] = (vertices, faces, geometry)
 
     def update_svg_overlay_transform(self, svg_id: str, x: float, y: float, z: float, rotation: float = 0):
         """
@@ -830,15 +959,28 @@ class Viewer3DWidget(QWidget):
             del self._svg_overlay_items[svg_id]
             return
 
-        # Create transform matrix
-        from PyQt5.QtGui import QMatrix4x4
-        transform = QMatrix4x4()
-        transform.translate(x, y, z)
-        if rotation != 0:
-            transform.rotate(rotation, 0, 0, 1)
+        # Reuse one matrix per overlay; skip frames where nothing moved
+        transform, last = self._svg_overlay_xforms.get(svg_id, (None, None))
+        key = (x, y, z, rotation)
+        if key == last:
+            return
+        if transform is None:
+            transform = QMatrix4x4()
+            last = None
+        if rotation == 0 and last is not None and last[3] == 0:
+            # Translation-only drag (the common case): the matrix is already
+            # a pure translation, so just overwrite its offset column
+            transform.setColumn(3, QVector4D(x, y, z, 1.0))
+        else:
+            transform.setToIdentity()
+            transform.translate(x, y, z)
+            if rotation != 0:
+                transform.rotate(rotation, 0, 0, 1)
 
         # Apply transform - this is instant, no geometry rebuild
+        # (setTransform copies the matrix)
         mesh_item.setTransform(transform)
+        self._svg_overlay_xforms[svg_id] = (transform, key)
 
     def remove_svg_overlay(self, svg_id: str):
         """Remove a specific SVG overlay."""
@@ -848,6 +990,7 @@ class Viewer3DWidget(QWidget):
             del self._svg_overlay_items[svg_id]
         if svg_id in self._svg_overlay_data:
             del self._svg_overlay_data[svg_id]
+        self._svg_overlay_xforms.pop(svg_id, None)
 
     def clear_svg_overlays(self):
         """Remove all SVG overlays."""
@@ -887,7 +1030,7 @@ class Viewer3DWidget(QWidget):
         overlay_color = (0.6, 0.8, 1.0, 0.8)  # Light blue, slightly transparent
 
         # Create mesh item
-        mesh_data = gl.MeshData(vertexes=vertices, faces=faces)
+        mesh_data = self._make_mesh_data(vertices, faces)
         mesh_item = gl.GLMeshItem(
             meshdata=mesh_data,
             smooth=True,
@@ -902,7 +1045,7 @@ class Viewer3DWidget(QWidget):
 
         # Store references
         self._baseplate_overlay_item = mesh_item
-        self._baseplate_overlay_data = (vertices.copy(), faces.copy(), base_width, base_height, base_thickness)
+        self._baseplate_overlay_data = (vertices, faces, base_width, base_height, base_thickness)
 
     def update_baseplate_scale(self, new_width: float, new_height: float, new_thickness: float):
         """
@@ -981,7 +1124,7 @@ class Viewer3DWidget(QWidget):
         overlay_color = (1.0, 0.9, 0.5, 0.9)  # Golden yellow for text
 
         # Create mesh item
-        mesh_data = gl.MeshData(vertexes=vertices, faces=faces)
+        mesh_data = self._make_mesh_data(vertices, faces)
         mesh_item = gl.GLMeshItem(
             meshdata=mesh_data,
             smooth=True,
@@ -996,7 +1139,7 @@ class Viewer3DWidget(QWidget):
 
         # Store references
         self._text_overlay_item = mesh_item
-        self._text_overlay_data = (vertices.copy(), faces.copy(), base_size, base_depth)
+        self._text_overlay_data = (vertices, faces, base_size, base_depth)
 
     def update_text_scale(self, new_size: float, new_depth: float):
         """
@@ -1074,7 +1217,7 @@ class Viewer3DWidget(QWidget):
         overlay_color = (0.5, 1.0, 0.6, 0.85)  # Light green for border
 
         # Create mesh item
-        mesh_data = gl.MeshData(vertexes=vertices, faces=faces)
+        mesh_data = self._make_mesh_data(vertices, faces)
         mesh_item = gl.GLMeshItem(
             meshdata=mesh_data,
             smooth=True,
@@ -1089,7 +1232,7 @@ class Viewer3DWidget(QWidget):
 
         # Store references
         self._border_overlay_item = mesh_item
-        self._border_overlay_data = (vertices.copy(), faces.copy(), base_width, base_height)
+        self._border_overlay_data = (vertices, faces, base_width, base_height)
 
     def update_border_scale(self, new_width: float, new_height: float):
         """
@@ -1163,8 +1306,10 @@ class Viewer3DWidget(QWidget):
             del self._svg_overlay_items[svg_id]
             return
 
+        # Replaces any position transform, so the next move must re-apply
+        self._svg_overlay_xforms.pop(svg_id, None)
+
         # Create transform matrix with uniform scale
-        from PyQt5.QtGui import QMatrix4x4
         transform = QMatrix4x4()
         transform.scale(scale, scale, scale)
 
@@ -1216,12 +1361,48 @@ class PreviewManager:
     Manages the 3D preview, handling updates and caching.
     """
 
+    # Coalescing window for non-immediate updates (~one frame at 60 Hz)
+    UPDATE_INTERVAL_MS = 16
+
     def __init__(self, viewer: Viewer3DWidget):
         self.viewer = viewer
-        self._pending_update = False
-        self._update_timer = None
+        # Latest deferred update: (kind, args, clear_overlays); bursts
+        # collapse onto it
+        self._pending = None
+        self._update_timer = QTimer()
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self._flush)
+
+    def _schedule(self, kind: str, args: tuple, clear_overlays: bool):
+        """Replace the pending update and arm the timer if idle."""
+        self._pending = (kind, args, clear_overlays)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _flush(self):
+        """Apply the most recent deferred update."""
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        kind, args, clear_overlays = pending
+        if kind == 'single':
+            geometry, auto_fit = args
+            self.viewer.set_geometry(geometry, auto_fit=auto_fit)
+        else:
+            base_geometry, text_geometry, auto_fit = args
+            self.viewer.set_geometries(base_geometry, text_geometry, auto_fit=auto_fit)
+        # Drop drag overlays only once the geometry replacing them is shown
+        if clear_overlays:
+            self.viewer.clear_svg_overlays()
+
+    def _cancel_pending(self):
+        """Drop any deferred update."""
+        self._update_timer.stop()
+        self._pending = None
 
-    def update_preview(self, geometry, immediate: bool = False, auto_fit: bool = False):
+    def update_preview(self, geometry, immediate: bool = False, auto_fit: bool = False,
+                       clear_overlays: bool = False):
         """
         Update the preview with new geometry.
 
@@ -1229,15 +1410,18 @@ class PreviewManager:
             geometry: CadQuery geometry to display
             immediate: If True, update immediately. Otherwise, debounce.
             auto_fit: If True, fit view to model. Default False to preserve camera.
+            clear_overlays: If True, clear SVG overlays once the geometry is shown.
         """
         if immediate:
+            self._cancel_pending()
             self.viewer.set_geometry(geometry, auto_fit=auto_fit)
+            if clear_overlays:
+                self.viewer.clear_svg_overlays()
         else:
-            # Debounced update would go here
-            # For now, just update immediately
-            self.viewer.set_geometry(geometry, auto_fit=auto_fit)
+            self._schedule('single', (geometry, auto_fit), clear_overlays)
 
-    def update_preview_separate(self, base_geometry, text_geometry, immediate: bool = False, auto_fit: bool = False):
+    def update_preview_separate(self, base_geometry, text_geometry, immediate: bool = False, auto_fit: bool = False,
+                                clear_overlays: bool = False):
         """
         Update the preview with separate base and text geometries (different colors).
 
@@ -1246,15 +1430,19 @@ class PreviewManager:
             text_geometry: CadQuery geometry for text
             immediate: If True, update immediately. Otherwise, debounce.
             auto_fit: If True, fit view to model. Default False to preserve camera.
+            clear_overlays: If True, clear SVG overlays once the geometry is shown.
         """
         if immediate:
+            self._cancel_pending()
             self.viewer.set_geometries(base_geometry, text_geometry, auto_fit=auto_fit)
+            if clear_overlays:
+                self.viewer.clear_svg_overlays()
         else:
-            # For now, just update immediately
-            self.viewer.set_geometries(base_geometry, text_geometry, auto_fit=auto_fit)
+            self._schedule('separate', (base_geometry, text_geometry, auto_fit), clear_overlays)
 
     def clear_preview(self):
         """Clear the preview."""
+        self._cancel_pending()
         self.viewer.clear_geometry()
 
     # --- SVG Overlay Methods for Real-Time Preview ---
@@ -1272,8 +1460,12 @@ class PreviewManager:
         self.viewer.remove_svg_overlay(svg_id)
 
     def clear_svg_overlays(self):
-        """Clear all SVG overlays."""
-        self.viewer.clear_svg_overlays()
+        """Clear all SVG overlays, after any pending update is shown."""
+        if self._pending is not None:
+            kind, args, _ = self._pending
+            self._pending = (kind, args, True)
+        else:
+            self.viewer.clear_svg_overlays()
 
     def has_svg_overlay(self, svg_id: str) -> bool:
         """Check if an SVG overlay exists."""
@@ -4,10 +4,15 @@ Encapsulates arc text configuration UI.
 """
 
 from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, pyqtSlot
 from ui.widgets.slider_spin import SliderSpinBox, ResetableComboBox
 
 
+# Direction combo text <-> config value
+_ARC_DIR_FWD = {"Counterclockwise": "counterclockwise", "Clockwise": "clockwise"}
+_ARC_DIR_REV = {v: k for k, v in _ARC_DIR_FWD.items()}
+
+
 class ArcOptionsWidget(QGroupBox):
     """
     Widget for arc text options.
@@ -55,21 +60,22 @@ class ArcOptionsWidget(QGroupBox):
         dir_row.addWidget(self._direction_combo, stretch=1)
         layout.addLayout(dir_row)
 
+    @pyqtSlot()
     def _on_changed(self):
         """Emit changed signal."""
         self.changed.emit()
 
-    def _on_dragging(self, is_dragging: bool):
-        """Emit dragging signal."""
-        self.dragging.emit(is_dragging)
+    @pyqtSlot(float)
+    def _on_dragging(self, value: float):
+        """Emit dragging signal for a slider drag value."""
+        self.dragging.emit(True)
 
     def get_config(self) -> dict:
         """Get arc configuration as dictionary."""
-        dir_map = {"Counterclockwise": "counterclockwise", "Clockwise": "clockwise"}
         return {
             'arc_radius': self._radius_slider.value(),
             'arc_angle': self._angle_slider.value(),
-            'arc_direction': dir_map.get(self._direction_combo.currentText(), 'counterclockwise'),
+            'arc_direction': _ARC_DIR_FWD.get(self._direction_combo.currentText(), 'counterclockwise'),
         }
 
     def set_config(self, config: dict):
@@ -79,9 +85,8 @@ class ArcOptionsWidget(QGroupBox):
         if 'arc_angle' in config:
             self._angle_slider.setValue(config['arc_angle'])
         if 'arc_direction' in config:
-            dir_map = {"counterclockwise": "Counterclockwise", "clockwise": "Clockwise"}
             self._direction_combo.setCurrentText(
-                dir_map.get(config['arc_direction'], 'Counterclockwise')
+                _ARC_DIR_REV.get(config['arc_direction'], 'Counterclockwise')
             )
 
     def reset_to_defaults(self):
@@ -102,6 +107,7 @@ class ArcEnableWidget(QCheckBox):
         self._arc_options = arc_options_widget
         self.stateChanged.connect(self._on_state_changed)
 
+    @pyqtSlot(int)
     def _on_state_changed(self, state: int):
         """Show/hide arc options based on checkbox state."""
         enabled = state == 2  # Qt.Checked
@@ -6,10 +6,48 @@ from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QSlider, QDoubleSpinBox,
     QSpinBox, QLabel, QComboBox, QLineEdit, QPushButton, QFrame
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QSignalBlocker, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QWheelEvent
 
 
+# Fixed style sheets shared by every instance instead of re-built per widget
+_RESET_BTN_QSS = """
+    QPushButton {
+        font-size: 12px;
+        padding: 0;
+        border: 1px solid #555;
+        border-radius: 3px;
+        background-color: #404040;
+    }
+    QPushButton:hover {
+        background-color: #505050;
+    }
+"""
+
+_HEADER_QSS = """
+    QPushButton {
+        text-align: left;
+        padding: 5px;
+        background-color: #404040;
+        border: none;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #505050;
+    }
+"""
+
+# ColorButton sheet; only the rgb() fill varies
+_COLOR_BTN_QSS_FMT = """
+    QPushButton {
+        background-color: rgb(%d, %d, %d);
+        border: 1px solid #666;
+        min-width: 40px;
+        min-height: 25px;
+    }
+"""
+
+
 class FocusComboBox(QComboBox):
     """
     ComboBox that only responds to wheel events when it has focus.
@@ -146,30 +184,25 @@ class SliderSpinBox(QWidget):
             self._reset_btn = QPushButton("↺")
             self._reset_btn.setFixedSize(22, 22)
             self._reset_btn.setToolTip(f"Reset to default ({default}{suffix})")
-            self._reset_btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 12px;
-                    padding: 0;
-                    border: 1px solid #555;
-                    border-radius: 3px;
-                    background-color: #404040;
-                }
-                QPushButton:hover {
-                    background-color: #505050;
-                }
-            """)
-            self._reset_btn.clicked.connect(self.reset_to_default)
+            self._reset_btn.setStyleSheet(_RESET_BTN_QSS)
+            self._reset_btn.clicked.connect(self._on_reset_clicked)
             layout.addWidget(self._reset_btn)
         else:
             self._reset_btn = None
 
-        self._updating = False
+    @pyqtSlot()
+    def _on_reset_clicked(self):
+        """Reset from the button; unlike reset_to_default(), this is a user edit."""
+        self.reset_to_default()
+        self.valueChanged.emit(self._default)
 
+    @pyqtSlot()
     def _on_slider_pressed(self):
         """Track when slider is being dragged."""
         self._slider_pressed = True
         self.dragStarted.emit()
 
+    @pyqtSlot()
     def _on_slider_released(self):
         """Emit value when slider is released."""
         self._slider_pressed = False
@@ -179,12 +212,12 @@ class SliderSpinBox(QWidget):
             float_val = self._slider.value() / self._multiplier
             self.valueChanged.emit(float_val)
 
+    @pyqtSlot(int)
     def _on_slider_changed(self, value):
-        if self._updating:
-            return
-        self._updating = True
         float_val = value / self._multiplier
-        self._spinbox.setValue(float_val)
+        # Mirror into the spinbox without re-entering _on_spinbox_changed
+        with QSignalBlocker(self._spinbox):
+            self._spinbox.setValue(float_val)
 
         # Emit dragging signal during drag for real-time preview
         if self._slider_pressed:
@@ -194,24 +227,19 @@ class SliderSpinBox(QWidget):
         if not self._defer_slider_updates or not self._slider_pressed:
             self.valueChanged.emit(float_val)
 
-        self._updating = False
-
+    @pyqtSlot(float)
     def _on_spinbox_changed(self, value):
-        if self._updating:
-            return
-        self._updating = True
-        self._slider.setValue(int(value * self._multiplier))
+        with QSignalBlocker(self._slider):
+            self._slider.setValue(int(value * self._multiplier))
         self.valueChanged.emit(value)
-        self._updating = False
     
     def value(self) -> float:
         return self._spinbox.value()
     
     def setValue(self, value: float):
-        self._updating = True
-        self._spinbox.setValue(value)
-        self._slider.setValue(int(value * self._multiplier))
-        self._updating = False
+        with QSignalBlocker(self._spinbox), QSignalBlocker(self._slider):
+            self._spinbox.setValue(value)
+            self._slider.setValue(int(value * self._multiplier))
     
     def setRange(self, min_val: float, max_val: float):
         self._slider.setMinimum(int(min_val * self._multiplier))
@@ -219,6 +247,7 @@ class SliderSpinBox(QWidget):
         self._spinbox.setMinimum(min_val)
         self._spinbox.setMaximum(max_val)
 
+    @pyqtSlot()
     def reset_to_default(self):
         """Reset to the default value."""
         self.setValue(self._default)
@@ -255,18 +284,7 @@ class ResetableComboBox(QWidget):
             self._reset_btn = QPushButton("↺")
             self._reset_btn.setFixedSize(22, 22)
             self._reset_btn.setToolTip(f"Reset to default ({default_text})")
-            self._reset_btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 12px;
-                    padding: 0;
-                    border: 1px solid #555;
-                    border-radius: 3px;
-                    background-color: #404040;
-                }
-                QPushButton:hover {
-                    background-color: #505050;
-                }
-            """)
+            self._reset_btn.setStyleSheet(_RESET_BTN_QSS)
             self._reset_btn.clicked.connect(self.reset_to_default)
             layout.addWidget(self._reset_btn)
         else:
@@ -296,6 +314,7 @@ class ResetableComboBox(QWidget):
     def currentData(self):
         return self._combo.currentData()
 
+    @pyqtSlot()
     def reset_to_default(self):
         """Reset to the default value."""
         if self._default_text:
@@ -405,18 +424,7 @@ class CollapsibleSection(QWidget):
         
         # Header button
         self._header = QPushButton(f"▼ {title}")
-        self._header.setStyleSheet("""
-            QPushButton {
-                text-align: left;
-                padding: 5px;
-                background-color: #404040;
-                border: none;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-        """)
+        self._header.setStyleSheet(_HEADER_QSS)
         self._header.clicked.connect(self._toggle)
         layout.addWidget(self._header)
         
@@ -428,6 +436,7 @@ class CollapsibleSection(QWidget):
         
         self._title = title
     
+    @pyqtSlot()
     def _toggle(self):
         self._expanded = not self._expanded
         self._content.setVisible(self._expanded)
@@ -457,16 +466,9 @@ class ColorButton(QPushButton):
         self.clicked.connect(self._on_clicked)
     
     def _update_style(self):
-        r, g, b = self._color[:3]
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgb({r}, {g}, {b});
-                border: 1px solid #666;
-                min-width: 40px;
-                min-height: 25px;
-            }}
-        """)
+        self.setStyleSheet(_COLOR_BTN_QSS_FMT % tuple(self._color[:3]))
     
+    @pyqtSlot()
     def _on_clicked(self):
         from PyQt5.QtWidgets import QColorDialog
         from PyQt5.QtGui import QColor
@@ -12,6 +12,15 @@ from pathlib import Path
 from typing import Optional
 
 
+# Public logging methods replaced by _noop on the instance while disabled
+_LOG_METHODS = ('debug', 'info', 'warning', 'error', 'exception',
+                'log_geometry', 'log_ui', 'log_preset', 'log_export')
+
+
+def _noop(*args, **kwargs):
+    """Stand-in for logging methods while logging is disabled."""
+
+
 class DebugLogger:
     """Centralized debug logger with toggle capability."""
 
@@ -47,6 +56,21 @@ class DebugLogger:
         # Callbacks for UI updates
         self._status_callbacks = []
 
+        self._bind_methods()
+
+    def _bind_methods(self):
+        """
+        Point the logging methods at no-ops while disabled.
+
+        Disabled calls then cost one attribute lookup; enabling drops the
+        instance overrides so the class methods are visible again.
+        """
+        for name in _LOG_METHODS:
+            if self._enabled:
+                self.__dict__.pop(name, None)
+            else:
+                setattr(self, name, _noop)
+
     @property
     def enabled(self) -> bool:
         return self._enabled
@@ -61,6 +85,7 @@ class DebugLogger:
             return
 
         self._enabled = True
+        self._bind_methods()
         self._logger.addHandler(self._console_handler)
 
         # Create log file
@@ -89,7 +114,7 @@ class DebugLogger:
         ))
         self._logger.addHandler(self._file_handler)
 
-        self._logger.info(f"Debug logging enabled. Log file: {self._log_file}")
+        self._logger.info("Debug logging enabled. Log file: %s", self._log_file)
         self._notify_status_change()
 
     def disable(self):
@@ -99,6 +124,7 @@ class DebugLogger:
 
         self._logger.info("Debug logging disabled")
         self._enabled = False
+        self._bind_methods()
 
         # Remove handlers
         self._logger.removeHandler(self._console_handler)
@@ -134,64 +160,49 @@ class DebugLogger:
             except Exception:
                 pass
 
-    # Logging methods
+    # Logging methods (only reachable while enabled, see _bind_methods)
     def debug(self, msg: str, *args, **kwargs):
-        if self._enabled:
-            self._logger.debug(msg, *args, **kwargs)
+        self._logger.debug(msg, *args, **kwargs)
 
     def info(self, msg: str, *args, **kwargs):
-        if self._enabled:
-            self._logger.info(msg, *args, **kwargs)
+        self._logger.info(msg, *args, **kwargs)
 
     def warning(self, msg: str, *args, **kwargs):
-        if self._enabled:
-            self._logger.warning(msg, *args, **kwargs)
+        self._logger.warning(msg, *args, **kwargs)
 
     def error(self, msg: str, *args, **kwargs):
-        if self._enabled:
-            self._logger.error(msg, *args, **kwargs)
+        self._logger.error(msg, *args, **kwargs)
 
     def exception(self, msg: str, *args, **kwargs):
-        if self._enabled:
-            self._logger.exception(msg, *args, **kwargs)
+        self._logger.exception(msg, *args, **kwargs)
 
     def log_geometry(self, operation: str, details: dict):
         """Log geometry operations with structured data."""
-        if not self._enabled:
-            return
         detail_str = ', '.join(f"{k}={v}" for k, v in details.items())
-        self._logger.debug(f"GEOMETRY: {operation} - {detail_str}")
+        self._logger.debug("GEOMETRY: %s - %s", operation, detail_str)
 
     def log_ui(self, event: str, widget: str, details: str = ""):
         """Log UI events."""
-        if not self._enabled:
-            return
-        msg = f"UI: {event} on {widget}"
         if details:
-            msg += f" - {details}"
-        self._logger.debug(msg)
+            self._logger.debug("UI: %s on %s - %s", event, widget, details)
+        else:
+            self._logger.debug("UI: %s on %s", event, widget)
 
     def log_preset(self, action: str, name: str, details: str = ""):
         """Log preset operations."""
-        if not self._enabled:
-            return
-        msg = f"PRESET: {action} '{name}'"
         if details:
-            msg += f" - {details}"
-        self._logger.info(msg)
+            self._logger.info("PRESET: %s '%s' - %s", action, name, details)
+        else:
+            self._logger.info("PRESET: %s '%s'", action, name)
 
     def log_export(self, format: str, path: str, success: bool, details: str = ""):
         """Log export operations."""
-        if not self._enabled:
-            return
+        level = logging.INFO if success else logging.ERROR
         status = "SUCCESS" if success else "FAILED"
-        msg = f"EXPORT: {format} to {path} - {status}"
         if details:
-            msg += f" - {details}"
-        if success:
-            self._logger.info(msg)
+            self._logger.log(level, "EXPORT: %s to %s - %s - %s", format, path, status, details)
         else:
-            self._logger.error(msg)
+            self._logger.log(level, "EXPORT: %s to %s - %s", format, path, status)
 
 
 # Global singleton instance